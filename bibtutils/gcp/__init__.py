@@ -1,13 +1,18 @@
+import importlib
 from warnings import warn
 
 from bibtutils.version import __version__
 
-__all__ = ["storage", "bigquery", "secrets", "pubsub"]
+__all__ = ["storage", "bigquery", "bigquery_stream", "secrets", "pubsub"]
+
+
+def __getattr__(name):
+    # Submodules are imported on first access, so that importing one of
+    # them doesn't pull in every other GCP client library as well.
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from bibtutils.gcp import storage
-from bibtutils.gcp import secrets
-from bibtutils.gcp import pubsub
-from bibtutils.gcp import bigquery
 
 warn(
     "This library is deprecated. Please use a supported library: "
@@ -8,11 +8,24 @@ See the official BigQuery Python Client documentation here:
 `link <https://googleapis.dev/python/bigquery/latest/index.html>`_.
 
 """
+import asyncio
+import atexit
+import datetime
+import functools
+import importlib.util
+import json
 import logging
+import threading
+import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from warnings import warn
 
+import google.auth.credentials
 from google.api_core import exceptions as google_exceptions
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import bigquery
+from requests.adapters import HTTPAdapter
 
 warn(
     "This library is deprecated. Please use a supported library: "
@@ -22,6 +35,113 @@ warn(
 
 _LOGGER = logging.getLogger(__name__)
 
+# Connections kept open per host by each cached client's HTTP session; the
+# requests default of 10 throttles the thread pools used by query_many and
+# create_and_upload_many.
+_HTTP_POOL_SIZE = 50
+
+# BQ parameter types for the Python types accepted as query parameter values.
+_PARAM_TYPES = {
+    bool: "BOOL",
+    int: "INT64",
+    float: "FLOAT64",
+    str: "STRING",
+    bytes: "BYTES",
+    datetime.datetime: "TIMESTAMP",
+    datetime.date: "DATE",
+}
+
+# Table schemas fetched by _get_schema, keyed by (bq_project, dataset, table,
+# credentials); at most _SCHEMA_CACHE_MAXSIZE are kept.
+_SCHEMA_CACHE = {}
+_SCHEMA_CACHE_LOCK = threading.Lock()
+_SCHEMA_CACHE_MAXSIZE = 256
+
+# Result sets larger than this are hydrated via Arrow rather than row by row.
+_ARROW_MIN_ROWS = 1000
+
+_PARTITION_MAP = {
+    "HOUR": bigquery.TimePartitioningType.HOUR,
+    "DAY": bigquery.TimePartitioningType.DAY,
+    "MONTH": bigquery.TimePartitioningType.MONTH,
+    "YEAR": bigquery.TimePartitioningType.YEAR,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _get_client(project=None, credentials=None):
+    """
+    Helper method to return a cached BigQuery client for the given project
+    and credentials, so repeated calls reuse the same auth session and HTTP
+    transport instead of rebuilding them on every API call.
+
+    Credentials objects hash by identity, so callers making many calls
+    should reuse a single credentials instance rather than creating a new
+    one per call (which would also create a new client per call).
+
+    The client's HTTP session keeps up to ``_HTTP_POOL_SIZE`` connections
+    open, so that concurrent calls sharing it don't queue for a connection.
+
+    :type project: :py:class:`str`
+    :param project: (Optional) the project to bind the client to. If not
+        specified, defaults to the environment's credential's project.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if
+        not to use the account running the function for authentication.
+
+    :rtype: :py:class:`gcp_bigquery:google.cloud.bigquery.client.Client`
+    :returns: a BigQuery client.
+    """
+    _LOGGER.debug("Creating BigQuery client for project: [%s]", project)
+    if credentials is None:
+        credentials, _ = google.auth.default(scopes=bigquery.Client.SCOPE)
+    else:
+        credentials = google.auth.credentials.with_scopes_if_required(
+            credentials, bigquery.Client.SCOPE
+        )
+    session = AuthorizedSession(credentials)
+    adapter = HTTPAdapter(
+        pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE
+    )
+    session.mount("https://", adapter)
+    client = bigquery.Client(project=project, credentials=credentials, _http=session)
+    _OPEN_CLIENTS.add(client)
+    return client
+
+
+_OPEN_CLIENTS = weakref.WeakSet()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_read_client(credentials=None):
+    """
+    Helper method to return a cached BigQuery Storage Read API client, so
+    that Arrow downloads of large results share one gRPC channel rather
+    than each opening (and tearing down) their own.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if
+        not to use the account running the function for authentication.
+
+    :rtype: :py:class:`gcp_bigquery_storage:google.cloud.bigquery_storage_v1.BigQueryReadClient`
+    :returns: a Storage Read API client.
+    """
+    from google.cloud import bigquery_storage_v1
+
+    _LOGGER.debug("Creating BigQuery Storage Read API client.")
+    return bigquery_storage_v1.BigQueryReadClient(credentials=credentials)
+
+
+@atexit.register
+def _close_clients():
+    """
+    Helper method to close the HTTP sessions of any cached clients when the
+    interpreter exits.
+    """
+    for client in list(_OPEN_CLIENTS):
+        client.close()
+
 
 def create_dataset(
     bq_project,
@@ -63,23 +183,25 @@ def create_dataset(
     dataset.location = location
     dataset.description = description
 
-    _LOGGER.info(f"Attempting to create dataset: {dataset_id}")
+    _LOGGER.info("Attempting to create dataset: %s", dataset_id)
     _LOGGER.info("Sending dataset API request...")
     try:
-        client = bigquery.Client(project=bq_project, credentials=credentials)
+        client = _get_client(bq_project, credentials)
         dataset = client.create_dataset(dataset, timeout=30, **kwargs)
-        _LOGGER.info(f"Dataset created: {dataset_id}")
+        _LOGGER.info("Dataset created: %s", dataset_id)
     except (
         google_exceptions.NotFound,
         google_exceptions.GoogleAPICallError,
         google_exceptions.PermissionDenied,
     ) as e:
-        if google_exceptions.PermissionDenied:
+        if isinstance(e, google_exceptions.PermissionDenied):
             _LOGGER.error(
                 "Current account does not have required permissions to create "
-                f"bigquery table in GCP project: [{bq_project}]. Navigate to "
-                f"https://console.cloud.google.com/iam-admin/iam?project={bq_project} "
-                'and add the "BigQuery User" role to the appropriate account.'
+                "bigquery table in GCP project: [%s]. Navigate to "
+                "https://console.cloud.google.com/iam-admin/iam?project=%s "
+                'and add the "BigQuery User" role to the appropriate account.',
+                bq_project,
+                bq_project,
             )
         raise e
     return
@@ -121,28 +243,30 @@ def delete_dataset(
     """
     dataset_id = f"{bq_project}.{dataset_name}"
 
-    _LOGGER.info(f"Attempting to delete dataset: {dataset_id}")
+    _LOGGER.info("Attempting to delete dataset: %s", dataset_id)
     _LOGGER.info("Sending dataset API request...")
     try:
-        client = bigquery.Client(project=bq_project, credentials=credentials)
+        client = _get_client(bq_project, credentials)
         client.delete_dataset(
             dataset_id,
             delete_contents=delete_contents,
             not_found_ok=not_found_ok,
             **kwargs,
         )
-        _LOGGER.info(f"Dataset deleted: {dataset_id}")
+        _LOGGER.info("Dataset deleted: %s", dataset_id)
     except (
         google_exceptions.NotFound,
         google_exceptions.GoogleAPICallError,
         google_exceptions.PermissionDenied,
     ) as e:
-        if google_exceptions.PermissionDenied:
+        if isinstance(e, google_exceptions.PermissionDenied):
             _LOGGER.error(
                 "Current account does not have required permissions to create "
-                f"bigquery table in GCP project: [{bq_project}]. Navigate to "
-                f"https://console.cloud.google.com/iam-admin/iam?project={bq_project} "
-                'and add the "BigQuery User" role to the appropriate account.'
+                "bigquery table in GCP project: [%s]. Navigate to "
+                "https://console.cloud.google.com/iam-admin/iam?project=%s "
+                'and add the "BigQuery User" role to the appropriate account.',
+                bq_project,
+                bq_project,
             )
         raise e
     return
@@ -152,10 +276,12 @@ def create_table(
     bq_project,
     dataset,
     table,
-    schema_json=[],
+    schema_json=None,
     time_partitioning_interval=None,
     time_partitioning_field=None,
     credentials=None,
+    client=None,
+    schema=None,
     **kwargs,
 ):
     """
@@ -175,7 +301,7 @@ def create_table(
 
     :type schema_json: :py:class:`dict`
     :param schema_json: (Optional) the schema for the new table. Defaults
-        to an empty list (no schema). The format of the schema should be
+        to ``None`` (no schema). The format of the schema should be
         identical to what is returned by
         ``bq show --format=prettyjson project:dataset.table | jq '.schema.fields'``
 
@@ -183,8 +309,8 @@ def create_table(
     :param time_partitioning_interval: (Optional) if specified, will
         create the table with the time partitioning interval desired.
         Only recognizes values of: ``HOUR``, ``DAY``, ``MONTH``, or ``YEAR``.
-        Capitalization doesn't matter. If value is unrecognized, this parameter
-        will simply be ignored. Defaults to ``None``.
+        Capitalization doesn't matter. If value is unrecognized, a warning is
+        logged and this parameter is ignored. Defaults to ``None``.
 
     :type time_partitioning_field: :py:class:`str`
     :param time_partitioning_field: (Optional) if specified, will create
@@ -198,37 +324,46 @@ def create_table(
     :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
     :param credentials: the credentials object to use when making the API call, if
         not to use the account running the function for authentication.
+
+    :type client: :py:class:`gcp_bigquery:google.cloud.bigquery.client.Client`
+    :param client: (Optional) an existing BigQuery client to use. If not
+        specified, a cached client for ``bq_project`` and ``credentials``
+        is used.
+
+    :type schema: :py:class:`list`
+    :param schema: (Optional) a prebuilt list of
+        :py:class:`gcp_bigquery:google.cloud.bigquery.SchemaFields` to use
+        instead of parsing ``schema_json``. Defaults to ``None``.
     """
     table_id = f"{bq_project}.{dataset}.{table}"
-    _LOGGER.info(f"Attempting to create table: {table_id}")
-    schema_structs = []
-    if schema_json and len(schema_json) > 0:
-        _LOGGER.info("Building schema...")
-        schema_structs = _generate_schema_struct(schema_json)
-        _LOGGER.info("Schema built.")
+    _LOGGER.info("Attempting to create table: %s", table_id)
+    if schema is None:
+        schema = _generate_schema_struct(schema_json)
     _LOGGER.info("Sending create_table API request...")
-    client = bigquery.Client(project=bq_project, credentials=credentials)
-    table = bigquery.Table(table_id, schema=schema_structs)
+    client = client or _get_client(bq_project, credentials)
+    table = bigquery.Table(table_id, schema=schema)
     if time_partitioning_interval or time_partitioning_field:
         _LOGGER.info(
-            f"Partioning specified [{time_partitioning_interval}/"
-            f"{time_partitioning_field}]. Configuring..."
+            "Partioning specified [%s/%s]. Configuring...",
+            time_partitioning_interval,
+            time_partitioning_field,
+        )
+        interval = (
+            time_partitioning_interval.upper() if time_partitioning_interval else None
         )
-        partitioning_interval = None
-        if time_partitioning_interval:
-            if time_partitioning_interval.upper() == "HOUR":
-                partitioning_interval = bigquery.TimePartitioningType.HOUR
-            if time_partitioning_interval.upper() == "DAY":
-                partitioning_interval = bigquery.TimePartitioningType.DAY
-            if time_partitioning_interval.upper() == "MONTH":
-                partitioning_interval = bigquery.TimePartitioningType.MONTH
-            if time_partitioning_interval.upper() == "YEAR":
-                partitioning_interval = bigquery.TimePartitioningType.YEAR
+        partitioning_interval = _PARTITION_MAP.get(interval)
+        if interval and not partitioning_interval:
+            _LOGGER.warning(
+                "Unrecognized time_partitioning_interval [%s], ignoring. "
+                "Must be one of: %s",
+                time_partitioning_interval,
+                list(_PARTITION_MAP),
+            )
         table.time_partitioning = bigquery.TimePartitioning(
             type_=partitioning_interval, field=time_partitioning_field
         )
     table = client.create_table(table, **kwargs)
-    _LOGGER.info(f"Table created: {table_id}")
+    _LOGGER.info("Table created: %s", table_id)
     return
 
 
@@ -253,16 +388,19 @@ def delete_table(bq_project, dataset, table, credentials=None, **kwargs):
         not to use the account running the function for authentication.
     """
     table_id = f"{bq_project}.{dataset}.{table}"
-    _LOGGER.info(f"Attempting to delete table: {table_id}")
-    client = bigquery.Client(project=bq_project, credentials=credentials)
+    _LOGGER.info("Attempting to delete table: %s", table_id)
+    client = _get_client(bq_project, credentials)
     client.delete_table(table_id, **kwargs)
-    _LOGGER.info(f"Table deleted: {table_id}")
+    _LOGGER.info("Table deleted: %s", table_id)
     return
 
 
-def _get_schema(bq_project, dataset, table):
+def _get_schema(bq_project, dataset, table, credentials=None, refresh=False):
     """
-    Helper method to return the schema of a given table.
+    Helper method to return the schema of a given table. Schemas are
+    cached for the lifetime of the process, so later changes to the
+    table's schema will not be seen unless ``refresh`` is set. The cache
+    may be emptied with :func:`~bibtutils.gcp.bigquery.clear_schema_cache`.
 
     :type bq_project: :py:class:`str`
     :param bq_project: the bq project where the dataset lives.
@@ -272,16 +410,73 @@ def _get_schema(bq_project, dataset, table):
 
     :type table: :py:class:`str`
     :param table: the bq table to fetch the schema for.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if
+        not to use the account running the function for authentication.
+
+    :type refresh: :py:class:`bool`
+    :param refresh: (Optional) if true, fetches the schema from BQ and
+        replaces this table's cached schema. Defaults to ``False``.
+    """
+    key = (bq_project, dataset, table, credentials)
+    if not refresh:
+        with _SCHEMA_CACHE_LOCK:
+            schema = _SCHEMA_CACHE.get(key)
+        if schema is not None:
+            return schema
+    client = _get_client(bq_project, credentials)
+    schema = client.get_table(f"{bq_project}.{dataset}.{table}").schema
+    with _SCHEMA_CACHE_LOCK:
+        # Re-inserting moves the key to the end, so the dict stays oldest-first.
+        _SCHEMA_CACHE.pop(key, None)
+        _SCHEMA_CACHE[key] = schema
+        while len(_SCHEMA_CACHE) > _SCHEMA_CACHE_MAXSIZE:
+            del _SCHEMA_CACHE[next(iter(_SCHEMA_CACHE))]
+    return schema
+
+
+def clear_schema_cache(bq_project=None, dataset=None, table=None):
+    """
+    Drops table schemas cached by this module (e.g. by
+    :func:`~bibtutils.gcp.bigquery_stream.stream_rows`), so that they are
+    fetched again on next use, e.g. after a table's schema has changed.
+
+    .. code:: python
+
+        from bibtutils.gcp.bigquery import clear_schema_cache
+        clear_schema_cache('my_project', 'my_dataset', 'my_table')
+
+    :type bq_project: :py:class:`str`
+    :param bq_project: (Optional) only drop schemas of tables in this
+        project. If not specified, all cached schemas are dropped. Defaults
+        to ``None``.
+
+    :type dataset: :py:class:`str`
+    :param dataset: (Optional) only drop schemas of tables in this dataset.
+        Defaults to ``None``.
+
+    :type table: :py:class:`str`
+    :param table: (Optional) only drop the schema of this table. Defaults
+        to ``None``.
     """
-    client = bigquery.Client(project=bq_project)
-    table = client.get_table(f"{bq_project}.{dataset}.{table}")
-    return table.schema
+    with _SCHEMA_CACHE_LOCK:
+        for key in list(_SCHEMA_CACHE):
+            if all(
+                value is None or value == cached
+                for value, cached in zip((bq_project, dataset, table), key)
+            ):
+                del _SCHEMA_CACHE[key]
+    return
 
 
 def _generate_schema(bucket_name, blob_name, bq_project, dataset, credentials=None):
     """
     Helper method to get an auto-generated schema based on input data in a bucket. Note
-    that this will create and delete a temporary table in order to generate the schema.
+    that this will load the data into a temporary table (created by the load job
+    itself) in order to generate the schema, and delete that table afterwards.
+    Each call uses its own uniquely named table, so concurrent calls on the same
+    dataset don't interfere.
 
     :type bucket_name: :py:class:`str`
     :param bucket_name: the location of the input data to generate a schema for.
@@ -298,60 +493,88 @@ def _generate_schema(bucket_name, blob_name, bq_project, dataset, credentials=No
     :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
     :param credentials: the credentials object to use when making the API call, if
         not to use the account running the function for authentication.
+
+    :rtype: :py:class:`list`
+    :returns: the detected schema, in the same JSON format accepted by
+        :func:`~bibtutils.gcp.bigquery.create_table`.
     """
-    create_and_upload(
-        bucket_name,
-        blob_name,
-        bq_project,
-        dataset,
-        "temp_table_autodetect_schema",
-        autodetect_schema=True,
-        ignore_unknown=False,
-        credentials=credentials,
+    temp_table_id = (
+        f"{bq_project}.{dataset}.temp_table_autodetect_schema_{uuid.uuid4().hex}"
     )
-    schema = _get_schema(
-        bq_project, dataset, "temp_table_autodetect_schema", credentials=credentials
-    )
-    delete_table(
-        bq_project, dataset, "temp_table_autodetect_schema", credentials=credentials
+    _LOGGER.info("Detecting schema of gs://%s/%s...", bucket_name, blob_name)
+    client = _get_client(bq_project, credentials)
+    load_job = client.load_table_from_uri(
+        source_uris=f"gs://{bucket_name}/{blob_name}",
+        destination=bigquery.TableReference.from_string(temp_table_id),
+        job_config=bigquery.LoadJobConfig(
+            autodetect=True,
+            write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+        ),
     )
-    return schema
+    try:
+        _monitor_job(load_job)
+        schema = client.get_table(temp_table_id).schema
+    finally:
+        client.delete_table(temp_table_id, not_found_ok=True)
+    return [field.to_api_repr() for field in schema]
 
 
 def _generate_schema_struct(schema_json):
     """
     Helper method to take a BigQuery schema in JSON format and convert it
     to an array of :py:class:`gcp_bigquery:google.cloud.bigquery.SchemaFields`
-    objects for use with the BQ API.
+    objects for use with the BQ API. Parsing (including nested ``fields``,
+    ``policyTags``, ``precision``, ``scale`` and ``maxLength``) is delegated
+    to :py:meth:`gcp_bigquery:google.cloud.bigquery.SchemaField.from_api_repr`.
 
     :type schema_json: :py:class:`dict`
     :param schema_json: the schema for the new table. The format of
         the schema should be identical to what is returned by
         ``bq show --format=prettyjson project:dataset.table | jq '.schema.fields'
 
+    Results are cached by the schema's content, so repeated loads with the
+    same schema skip parsing entirely.
+
     :rtype: :py:class:`list`
     :returns: A list of :py:class:`gcp_bigquery:google.cloud.bigquery.SchemaFields`
         objects corresponding to the specified schema.
     """
-    schema_structs = []
-    for column in schema_json:
-        if "fields" in column.keys():
-            struct = bigquery.SchemaField(
-                column["name"],
-                column["type"],
-                mode=column.get("mode", "NULLABLE"),
-                description=column.get("description", None),
-                fields=_generate_schema_struct(column["fields"]),
-            )
-        else:
-            struct = bigquery.SchemaField(
-                column["name"],
-                column["type"],
-                mode=column.get("mode", "NULLABLE"),
-                description=column.get("description", None),
-            )
-        schema_structs.append(struct)
-    return schema_structs
+    if not schema_json:
+        return []
+    return list(_schema_struct_cached(json.dumps(schema_json, sort_keys=True)))
+
+
+@functools.lru_cache(maxsize=128)
+def _schema_struct_cached(schema_key):
+    """
+    Helper method backing :func:`_generate_schema_struct`, keyed on the
+    schema serialized with sorted keys. Raises :py:class:`ValueError` if
+    any top-level column lacks a ``name`` or ``type``.
+
+    :type schema_key: :py:class:`str`
+    :param schema_key: the JSON-serialized schema.
+
+    :rtype: :py:class:`tuple`
+    :returns: the :py:class:`gcp_bigquery:google.cloud.bigquery.SchemaFields`.
+    """
+    columns = json.loads(schema_key)
+    for column in columns:
+        if "name" not in column or "type" not in column:
+            raise ValueError(f"Schema column is missing a name or type: {column}")
+    from_api_repr = bigquery.SchemaField.from_api_repr
+    return tuple(from_api_repr(column) for column in columns)
+
+
+def _pyarrow_available():
+    """
+    Helper method to check whether ``pyarrow`` is importable, without
+    importing it.
+
+    :rtype: :py:class:`bool`
+    :returns: whether or not ``pyarrow`` is installed.
+    """
+    return importlib.util.find_spec("pyarrow") is not None
 
 
 def _monitor_job(job):
@@ -383,6 +606,9 @@ def upload_gcs_json(
     schema_json=None,
     credentials=None,
     await_result=True,
+    source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+    client=None,
+    schema=None,
     **kwargs,
 ):
     """
@@ -450,44 +676,334 @@ def upload_gcs_json(
 
     :type await_result: :py:class:`bool`
     :param await_result: Whether or not to hang and await the job result or
-        simply return None once the job is submitted.
+        simply return the load job once it is submitted.
+
+    :type source_format: :py:class:`str`
+    :param source_format: (Optional) the
+        :py:class:`gcp_bigquery:google.cloud.bigquery.enums.SourceFormat` of the
+        blob. Defaults to ``NEWLINE_DELIMITED_JSON``. Columnar formats such
+        as ``PARQUET`` load considerably faster; see
+        :func:`~bibtutils.gcp.bigquery.upload_gcs_parquet`.
+
+    :type client: :py:class:`gcp_bigquery:google.cloud.bigquery.client.Client`
+    :param client: (Optional) an existing BigQuery client to use. If not
+        specified, a cached client for ``bq_project`` and ``credentials``
+        is used.
+
+    :type schema: :py:class:`list`
+    :param schema: (Optional) a prebuilt list of
+        :py:class:`gcp_bigquery:google.cloud.bigquery.SchemaFields` to use
+        instead of parsing ``schema_json``. Defaults to ``None``.
+
+    :rtype: :py:class:`gcp_bigquery:google.cloud.bigquery.job.LoadJob` OR :py:class:`None`
+    :returns: the submitted load job if ``await_result`` is ``False``,
+        otherwise ``None``.
     """
-    source_uri = f"gs://{bucket_name}/{blob_name}"
+    return upload_gcs_json_batch(
+        bucket_name,
+        [blob_name],
+        bq_project,
+        dataset,
+        table,
+        append=append,
+        ignore_unknown=ignore_unknown,
+        autodetect_schema=autodetect_schema,
+        schema_json=schema_json,
+        credentials=credentials,
+        await_result=await_result,
+        source_format=source_format,
+        client=client,
+        schema=schema,
+        **kwargs,
+    )
+
+
+def upload_gcs_json_batch(
+    bucket_name,
+    blob_names,
+    bq_project,
+    dataset,
+    table,
+    append=True,
+    ignore_unknown=True,
+    autodetect_schema=False,
+    schema_json=None,
+    credentials=None,
+    await_result=True,
+    source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+    client=None,
+    schema=None,
+    **kwargs,
+):
+    """
+    Uploads several GCS blobs in JSON NLD format to the specified table in
+    BQ using a single load job. One job over many blobs is much cheaper
+    than one job per blob, and counts only once against the per-table
+    daily load job quota. Blob names may contain a ``*`` wildcard
+    (e.g. ``'exports/2023-01-01/*.json'``); BQ accepts up to 10,000 source
+    URIs per job.
+
+    Takes the same arguments and requires the same permissions as
+    :func:`~bibtutils.gcp.bigquery.upload_gcs_json`, except that
+    ``blob_names`` is a list.
+
+    .. code:: python
+
+        from bibtutils.gcp.bigquery import upload_gcs_json_batch
+        upload_gcs_json_batch(
+            bucket_name='my_bucket',
+            blob_names=['my_nldjson_blob_1', 'my_nldjson_blob_2'],
+            bq_project='my_project',
+            dataset='my_dataset',
+            table='my_table'
+        )
+
+    :type bucket_name: :py:class:`str`
+    :param bucket_name: the bucket hosting the specified blobs.
+
+    :type blob_names: :py:class:`list`
+    :param blob_names: the blobs to upload to BQ. must be in JSON NLD format.
+
+    :rtype: :py:class:`gcp_bigquery:google.cloud.bigquery.job.LoadJob` OR :py:class:`None`
+    :returns: the submitted load job if ``await_result`` is ``False``,
+        otherwise ``None``.
+    """
+    source_uris = [f"gs://{bucket_name}/{blob_name}" for blob_name in blob_names]
     table_ref = f"{bq_project}.{dataset}.{table}"
-    schema_struct = None
-    if schema_json:
-        if autodetect_schema:
-            _LOGGER.warn(
-                'You currently have "autodetect_schema" set to True while '
-                'also specifying a schema. Consider setting "autodetect_schema" '
-                "to False to avoid type inference conflicts."
-            )
+    schema_struct = schema
+    if schema_struct is None and schema_json:
         _LOGGER.info("Building schema...")
         schema_struct = _generate_schema_struct(schema_json)
         _LOGGER.info("Schema built.")
-    _LOGGER.info(f"Uploading {source_uri} to {table_ref}...")
+    if schema_struct and autodetect_schema:
+        _LOGGER.warn(
+            'You currently have "autodetect_schema" set to True while '
+            'also specifying a schema. Consider setting "autodetect_schema" '
+            "to False to avoid type inference conflicts."
+        )
+    _LOGGER.info(
+        "Uploading %s blob(s) from gs://%s to %s...",
+        len(source_uris),
+        bucket_name,
+        table_ref,
+    )
     if append:
         write_disp = bigquery.WriteDisposition.WRITE_APPEND
     else:
         write_disp = bigquery.WriteDisposition.WRITE_TRUNCATE
-    client = bigquery.Client(project=bq_project, credentials=credentials)
+    client = client or _get_client(bq_project, credentials)
     load_job = client.load_table_from_uri(
-        source_uris=source_uri,
-        destination=client.get_table(table_ref),
+        source_uris=source_uris,
+        destination=bigquery.TableReference.from_string(table_ref),
         job_config=bigquery.LoadJobConfig(
             autodetect=autodetect_schema,
             write_disposition=write_disp,
-            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            source_format=source_format,
             ignore_unknown_values=ignore_unknown,
             schema=schema_struct,
         ),
         **kwargs,
     )
 
-    if await_result:
-        _monitor_job(load_job)
-        _LOGGER.info(f"Upload of {source_uri} to BQ complete.")
+    if not await_result:
+        _LOGGER.debug("Not waiting for result of load job, returning job.")
+        return load_job
 
+    _monitor_job(load_job)
+    _LOGGER.info("Upload of %s blob(s) to BQ complete.", len(source_uris))
+    return
+
+
+def upload_gcs_parquet(
+    bucket_name,
+    blob_name,
+    bq_project,
+    dataset,
+    table,
+    append=True,
+    credentials=None,
+    await_result=True,
+    **kwargs,
+):
+    """
+    Uploads a GCS blob in Parquet format to the specified table in BQ.
+    Parquet files carry their own schema and are columnar, so they load
+    much faster than NLD JSON. The same permissions as
+    :func:`~bibtutils.gcp.bigquery.upload_gcs_json` apply.
+
+    Any extra args (``kwargs``) are passed to
+        :py:func:`gcp_bigquery:google.cloud.bigquery.client.Client.load_table_from_uri`.
+
+    .. code:: python
+
+        from bibtutils.gcp.bigquery import upload_gcs_parquet
+        upload_gcs_parquet(
+            bucket_name='my_bucket',
+            blob_name='my_blob.parquet',
+            bq_project='my_project',
+            dataset='my_dataset',
+            table='my_table'
+        )
+
+    :type bucket_name: :py:class:`str`
+    :param bucket_name: the bucket hosting the specified blob.
+
+    :type blob_name: :py:class:`str`
+    :param blob_name: the blob to upload to BQ. must be in Parquet format.
+
+    :type bq_project: :py:class:`str`
+    :param bq_project: the project hosting the specified BQ dataset.
+
+    :type dataset: :py:class:`str`
+    :param dataset: the dataset hosting the specified table.
+
+    :type table: :py:class:`str`
+    :param table: the table to which to upload the blob.
+
+    :type append: :py:class:`bool`
+    :param append: (Optional) if true, will append to table.
+        if false, will overwrite. Defaults to ``True``.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if
+        not to use the account running the function for authentication.
+
+    :type await_result: :py:class:`bool`
+    :param await_result: Whether or not to hang and await the job result or
+        simply return the load job once it is submitted.
+
+    :rtype: :py:class:`gcp_bigquery:google.cloud.bigquery.job.LoadJob` OR :py:class:`None`
+    :returns: the submitted load job if ``await_result`` is ``False``,
+        otherwise ``None``.
+    """
+    return upload_gcs_json_batch(
+        bucket_name,
+        [blob_name],
+        bq_project,
+        dataset,
+        table,
+        append=append,
+        ignore_unknown=False,
+        credentials=credentials,
+        await_result=await_result,
+        source_format=bigquery.SourceFormat.PARQUET,
+        **kwargs,
+    )
+
+
+def upload_local_json(
+    file_path,
+    bq_project,
+    dataset,
+    table,
+    append=True,
+    ignore_unknown=True,
+    autodetect_schema=False,
+    schema_json=None,
+    credentials=None,
+    await_result=True,
+    client=None,
+    **kwargs,
+):
+    """
+    Uploads a local file in JSON NLD format to the specified table in BQ,
+    without staging it in GCS first. The file is sent with a resumable
+    upload in 100MB chunks (the client library's default since
+    ``google-cloud-bigquery`` 2.26; older versions used 1MB chunks, which
+    made large uploads roughly ten times slower).
+
+    Executing account must have edit permissions on the dataset, in
+    addition to the IAM bigquery jobs user role in the project.
+
+    Any extra args (``kwargs``) are passed to
+        :py:func:`gcp_bigquery:google.cloud.bigquery.client.Client.load_table_from_file`.
+
+    .. code:: python
+
+        from bibtutils.gcp.bigquery import upload_local_json
+        upload_local_json(
+            file_path='/tmp/my_nldjson_file.json',
+            bq_project='my_project',
+            dataset='my_dataset',
+            table='my_table'
+        )
+
+    :type file_path: :py:class:`str`
+    :param file_path: the path of the file to upload to BQ. must be in
+        JSON NLD format.
+
+    :type bq_project: :py:class:`str`
+    :param bq_project: the project hosting the specified BQ dataset.
+
+    :type dataset: :py:class:`str`
+    :param dataset: the dataset hosting the specified table.
+
+    :type table: :py:class:`str`
+    :param table: the table to which to upload the file.
+
+    :type append: :py:class:`bool`
+    :param append: (Optional) if true, will append to table.
+        if false, will overwrite. Defaults to ``True``.
+
+    :type ignore_unknown: :py:class:`bool`
+    :param ignore_unknown: (Optional) if true, will ignore values not
+        reflected in table schema while uploading. Defaults to ``True``.
+
+    :type autodetect_schema: :py:class:`bool`
+    :param autodetect_schema: (Optional) if true, will instruct BQ to
+        automatically detect the schema of the data being uploaded.
+        Defaults to ``False``.
+
+    :type schema_json: :py:class:`dict`
+    :param schema_json: (Optional) the schema for the new table. Defaults
+        to an empty list (no schema).
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if
+        not to use the account running the function for authentication.
+
+    :type await_result: :py:class:`bool`
+    :param await_result: Whether or not to hang and await the job result or
+        simply return the load job once it is submitted.
+
+    :type client: :py:class:`gcp_bigquery:google.cloud.bigquery.client.Client`
+    :param client: (Optional) an existing BigQuery client to use. If not
+        specified, a cached client for ``bq_project`` and ``credentials``
+        is used.
+
+    :rtype: :py:class:`gcp_bigquery:google.cloud.bigquery.job.LoadJob` OR :py:class:`None`
+    :returns: the submitted load job if ``await_result`` is ``False``,
+        otherwise ``None``.
+    """
+    table_ref = f"{bq_project}.{dataset}.{table}"
+    schema_struct = _generate_schema_struct(schema_json)
+    if append:
+        write_disp = bigquery.WriteDisposition.WRITE_APPEND
+    else:
+        write_disp = bigquery.WriteDisposition.WRITE_TRUNCATE
+    client = client or _get_client(bq_project, credentials)
+    _LOGGER.info("Uploading %s to %s...", file_path, table_ref)
+    with open(file_path, "rb") as infile:
+        load_job = client.load_table_from_file(
+            infile,
+            destination=bigquery.TableReference.from_string(table_ref),
+            rewind=True,
+            job_config=bigquery.LoadJobConfig(
+                autodetect=autodetect_schema,
+                write_disposition=write_disp,
+                source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+                ignore_unknown_values=ignore_unknown,
+                schema=schema_struct,
+            ),
+            **kwargs,
+        )
+
+    if not await_result:
+        _LOGGER.debug("Not waiting for result of load job, returning job.")
+        return load_job
+
+    _monitor_job(load_job)
+    _LOGGER.info("Upload of %s to BQ complete.", file_path)
     return
 
 
@@ -555,8 +1071,8 @@ def create_and_upload(
     :param time_partitioning_interval: (Optional) if specified, will
         create the table with the time partitioning interval desired.
         Only recognizes values of: ``HOUR``, ``DAY``, ``MONTH``, or ``YEAR``.
-        Capitalization doesn't matter. If value is unrecognized, this parameter
-        will simply be ignored. Defaults to ``None``.
+        Capitalization doesn't matter. If value is unrecognized, a warning is
+        logged and this parameter is ignored. Defaults to ``None``.
 
     :type time_partitioning_field: :py:class:`str`
     :param time_partitioning_field: (Optional) if specified, will create
@@ -575,7 +1091,11 @@ def create_and_upload(
 
     :type await_result: :py:class:`bool`
     :param await_result: Whether or not to hang and await the job result or
-        simply return None once the job is submitted.
+        simply return the load job once it is submitted.
+
+    :rtype: :py:class:`gcp_bigquery:google.cloud.bigquery.job.LoadJob` OR :py:class:`None`
+    :returns: the submitted load job if ``await_result`` is ``False``,
+        otherwise ``None``.
     """
     _LOGGER.info("Starting create_and_upload...")
     if not schema_json and not autodetect_schema and not generate_schema:
@@ -590,21 +1110,32 @@ def create_and_upload(
         schema_json = _generate_schema(
             bucket_name, blob_name, bq_project, dataset, credentials=credentials
         )
-    try:
-        create_table(
-            bq_project,
-            dataset,
-            table,
-            schema_json=schema_json,
-            time_partitioning_interval=time_partitioning_interval,
-            time_partitioning_field=time_partitioning_field,
-            credentials=credentials,
-        )
-    except google_exceptions.Conflict as e:
-        if not already_created_ok:
-            raise e
+    schema = _generate_schema_struct(schema_json)
+    client = _get_client(bq_project, credentials)
+    table_exists = False
+    if already_created_ok:
+        try:
+            client.get_table(f"{bq_project}.{dataset}.{table}")
+            table_exists = True
+            _LOGGER.info("Table already exists, skipping creation.")
+        except google_exceptions.NotFound:
+            pass
+    if not table_exists:
+        try:
+            create_table(
+                bq_project,
+                dataset,
+                table,
+                schema=schema,
+                time_partitioning_interval=time_partitioning_interval,
+                time_partitioning_field=time_partitioning_field,
+                client=client,
+            )
+        except google_exceptions.Conflict as e:
+            if not already_created_ok:
+                raise e
 
-    upload_gcs_json(
+    load_job = upload_gcs_json(
         bucket_name,
         blob_name,
         bq_project,
@@ -613,22 +1144,124 @@ def create_and_upload(
         append=append,
         ignore_unknown=ignore_unknown,
         autodetect_schema=autodetect_schema,
-        schema_json=schema_json,
-        credentials=credentials,
+        schema=schema,
         await_result=await_result,
+        client=client,
     )
 
     _LOGGER.info("create_and_upload completed successfully.")
+    return load_job
+
+
+def create_and_upload_many(specs, max_workers=16):
+    """
+    Runs :func:`~bibtutils.gcp.bigquery.create_and_upload` for several
+    blobs/tables in parallel. Each call's table creation and load job are
+    sequential, but separate calls are independent, so running them in a
+    bounded thread pool overlaps their latency. All calls with the same
+    project and credentials share one cached client.
+
+    .. code:: python
+
+        from bibtutils.gcp.bigquery import create_and_upload_many
+        create_and_upload_many(
+            [
+                {
+                    'bucket_name': 'my_bucket',
+                    'blob_name': f'my_blob_{i}',
+                    'bq_project': 'my_project',
+                    'dataset': 'my_dataset',
+                    'table': f'my_table_{i}',
+                    'autodetect_schema': True,
+                }
+                for i in range(10)
+            ]
+        )
+
+    :type specs: :py:class:`list`
+    :param specs: a list of dicts, each being the keyword arguments for one
+        call to :func:`~bibtutils.gcp.bigquery.create_and_upload`.
+
+    :type max_workers: :py:class:`int`
+    :param max_workers: (Optional) the maximum number of calls to run
+        concurrently. Defaults to ``16``.
+
+    :rtype: :py:class:`list`
+    :returns: a list with one entry per spec, in the order given, each
+        being the return value of the corresponding call.
+    """
+    _LOGGER.info("Running create_and_upload for %s specs...", len(specs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(create_and_upload, **spec) for spec in specs]
+        results = [future.result() for future in futures]
+    _LOGGER.info("create_and_upload_many completed successfully.")
+    return results
+
+
+def wait_all(jobs):
+    """
+    Awaits a collection of BQ jobs, such as those returned by
+    :func:`~bibtutils.gcp.bigquery.upload_gcs_json` with
+    ``await_result=False``. Since all of the jobs are already running
+    server-side, the total wait approaches that of the slowest job rather
+    than the sum of all of them.
+
+    .. code:: python
+
+        from bibtutils.gcp.bigquery import upload_gcs_json, wait_all
+        jobs = [
+            upload_gcs_json(
+                'my_bucket', blob, 'my_project', 'my_dataset', 'my_table',
+                await_result=False
+            )
+            for blob in ['blob_1', 'blob_2']
+        ]
+        wait_all(jobs)
+
+    :type jobs: :py:class:`list`
+    :param jobs: the BigQuery jobs to await.
+    """
+    _LOGGER.info("Awaiting %s BQ jobs...", len(jobs))
+    for job in jobs:
+        _monitor_job(job)
+    _LOGGER.info("All BQ jobs complete.")
     return
 
 
-def query(query, query_project=None, credentials=None, await_result=True):
+def query(
+    query,
+    query_project=None,
+    credentials=None,
+    await_result=True,
+    bqstorage_client=None,
+    use_query_cache=True,
+    maximum_bytes_billed=None,
+    as_arrow=False,
+    dry_run=False,
+    params=None,
+    use_bqstorage=False,
+):
     """
     Sends the user-supplied query to BQ and returns the result
     as a list of dicts. The account running the query must have
     Job Create permissions in the GCP Project and at least
     Data Viewer on the target dataset.
 
+    If ``use_bqstorage=True`` (or a ``bqstorage_client`` is given), the
+    result has more than 1000 rows and ``pyarrow`` is installed, rows are
+    downloaded via the BigQuery Storage API and converted to dicts via
+    Arrow in a single pass instead of one at a time, which is considerably
+    faster for large results. This additionally requires the
+    ``bigquery.readsessions.create`` permission (e.g. BigQuery Read Session
+    User); without it, results are downloaded row by row as usual. Values
+    converted via Arrow may differ in type from those returned row by row
+    (e.g. ``NUMERIC`` and ``TIMESTAMP`` columns). Pass ``as_arrow=True`` to
+    skip the conversion and get the Arrow table itself.
+
+    By default BQ's query cache is used: an identical query string run
+    within the last 24 hours (against unchanged tables) is served from
+    cache, quickly and at no cost.
+
     .. code:: python
 
         from bibtutils.gcp.bigquery import query
@@ -652,22 +1285,471 @@ def query(query, query_project=None, credentials=None, await_result=True):
 
     :type await_result: :py:class:`bool`
     :param await_result: Whether or not to hang and await the job result or
-        simply return None once the job is submitted.
+        simply return the query job once it is submitted.
+
+    :type bqstorage_client: :py:class:`gcp_bigquery_storage:google.cloud.bigquery_storage_v1.BigQueryReadClient`
+    :param bqstorage_client: (Optional) a BigQuery Storage API client to use
+        when downloading large results via Arrow. Implies ``use_bqstorage``.
+
+    :type use_query_cache: :py:class:`bool`
+    :param use_query_cache: (Optional) whether or not to look for the result
+        in BQ's query cache. Defaults to ``True``.
+
+    :type maximum_bytes_billed: :py:class:`int`
+    :param maximum_bytes_billed: (Optional) if specified, the query will fail
+        (without incurring a charge) if it would bill more than this many
+        bytes. Defaults to ``None`` (no limit).
+
+    :type as_arrow: :py:class:`bool`
+    :param as_arrow: (Optional) whether to return the result as a
+        :py:class:`pyarrow.Table` instead of a list of dicts. Requires
+        ``pyarrow``. Defaults to ``False``.
+
+    :type dry_run: :py:class:`bool`
+    :param dry_run: (Optional) if true, the query is validated and its cost
+        estimated, but not run (and not billed). Defaults to ``False``.
+
+    :type params: :py:class:`dict` OR :py:class:`list`
+    :param params: (Optional) named query parameters, referenced in the
+        query as ``@name``. May be a dict of names to values (``bool``,
+        ``int``, ``float``, ``str``, ``bytes``, ``datetime``, ``date``, or
+        lists thereof) or a list of
+        :py:class:`gcp_bigquery:google.cloud.bigquery.ScalarQueryParameter`
+        (or other query parameter) objects. Prefer this to formatting values
+        into the query string. Defaults to ``None``.
+
+    :type use_bqstorage: :py:class:`bool`
+    :param use_bqstorage: (Optional) whether to download large results via
+        the BigQuery Storage API, using a cached client if
+        ``bqstorage_client`` is not given. Defaults to ``False``.
+
+    :rtype: :py:class:`list` OR :py:class:`dict` OR :py:class:`pyarrow.Table` OR :py:class:`gcp_bigquery:google.cloud.bigquery.job.QueryJob`
+    :returns: a list of dicts, one row in the result table per dict (or an
+        Arrow table if ``as_arrow`` is ``True``), or the submitted query
+        job if ``await_result`` is ``False``. If ``dry_run`` is ``True``,
+        a dict of the form ``{'total_bytes_processed': <int>}``.
+    """
+    _LOGGER.debug("Sending query: %s", query)
+    bq_client = _get_client(query_project, credentials)
+    job_config = _query_job_config(
+        use_query_cache, maximum_bytes_billed, dry_run, params
+    )
+    _LOGGER.info("Querying BQ...")
+    query_job = bq_client.query(query, job_config=job_config)
+    if dry_run:
+        return _dry_run_result(query_job)
+    if not await_result:
+        _LOGGER.debug("Not waiting for result of query, returning job.")
+        return query_job
+    if use_bqstorage and bqstorage_client is None:
+        bqstorage_client = _get_read_client(credentials)
+    if as_arrow:
+        _LOGGER.info("Returning results as Arrow table.")
+        return _results_to_arrow(query_job.result(), bqstorage_client)
+    results_json = _results_to_json(query_job.result(), bqstorage_client)
+    _LOGGER.info("Returning results as list of dicts.")
+    return results_json
+
+
+def query_iter(
+    query,
+    query_project=None,
+    credentials=None,
+    use_query_cache=True,
+    maximum_bytes_billed=None,
+    dry_run=False,
+    params=None,
+):
+    """
+    Sends the user-supplied query to BQ and yields the result rows
+    one dict at a time as they are paged in, rather than building
+    the whole result in memory. Useful for large results that are
+    aggregated, filtered or written out as they are read. The same
+    permissions as :func:`~bibtutils.gcp.bigquery.query` apply.
+
+    .. code:: python
+
+        from bibtutils.gcp.bigquery import query_iter
+        for row in query_iter('select * from `my_project.my_dataset.my_table`'):
+            print(row['name'])
+
+    :type query: :py:class:`str`
+    :param query: a full BQ query (e.g. ``'select * from `x.y.z` where a=b'``)
+
+    :type query_project: :py:class:`str`
+    :param query_project: the ID of the project in which to run the query.
+        If not specified, defaults to the environment's credential's project.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if
+        not to use the account running the function for authentication.
+
+    :type use_query_cache: :py:class:`bool`
+    :param use_query_cache: (Optional) whether or not to look for the result
+        in BQ's query cache. Defaults to ``True``.
+
+    :type maximum_bytes_billed: :py:class:`int`
+    :param maximum_bytes_billed: (Optional) fail the query (without
+        incurring a charge) if it would bill more than this many bytes.
+        Defaults to ``None`` (no limit).
+
+    :type dry_run: :py:class:`bool`
+    :param dry_run: (Optional) if true, the query is validated and its cost
+        estimated, but not run (and not billed). Defaults to ``False``.
+
+    :type params: :py:class:`dict` OR :py:class:`list`
+    :param params: (Optional) named query parameters, referenced in the
+        query as ``@name``. See :func:`~bibtutils.gcp.bigquery.query`.
+        Defaults to ``None``.
+
+    :rtype: :py:class:`generator`
+    :returns: a generator of dicts, one row in the result table per dict.
+        If ``dry_run`` is ``True``, yields a single dict of the form
+        ``{'total_bytes_processed': <int>}``.
+    """
+    _LOGGER.debug("Sending query: %s", query)
+    bq_client = _get_client(query_project, credentials)
+    job_config = _query_job_config(
+        use_query_cache, maximum_bytes_billed, dry_run, params
+    )
+    _LOGGER.info("Querying BQ...")
+    query_job = bq_client.query(query, job_config=job_config)
+    if dry_run:
+        yield _dry_run_result(query_job)
+        return
+    yield from _iter_rows(query_job.result())
+
+
+async def query_async(
+    query,
+    query_project=None,
+    credentials=None,
+    use_query_cache=True,
+    maximum_bytes_billed=None,
+    dry_run=False,
+    params=None,
+):
+    """
+    Coroutine which sends the user-supplied query to BQ and returns the
+    result as a list of dicts. Submitting the job, waiting for it and
+    downloading the result rows is blocking I/O, so it runs in the loop's
+    default executor rather than on the event loop; many queries can be
+    awaited concurrently with :py:func:`asyncio.gather`, each occupying one
+    executor thread while it runs. The same permissions as
+    :func:`~bibtutils.gcp.bigquery.query` apply.
+
+    .. code:: python
+
+        import asyncio
+        from bibtutils.gcp.bigquery import query_async
+        async def main():
+            return await asyncio.gather(
+                query_async('select * from `my_project.my_dataset.table_1`'),
+                query_async('select * from `my_project.my_dataset.table_2`'),
+            )
+        table_1, table_2 = asyncio.run(main())
+
+    :type query: :py:class:`str`
+    :param query: a full BQ query (e.g. ``'select * from `x.y.z` where a=b'``)
+
+    :type query_project: :py:class:`str`
+    :param query_project: the ID of the project in which to run the query.
+        If not specified, defaults to the environment's credential's project.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if
+        not to use the account running the function for authentication.
+
+    :type use_query_cache: :py:class:`bool`
+    :param use_query_cache: (Optional) whether or not to look for the result
+        in BQ's query cache. Defaults to ``True``.
+
+    :type maximum_bytes_billed: :py:class:`int`
+    :param maximum_bytes_billed: (Optional) fail the query (without
+        incurring a charge) if it would bill more than this many bytes.
+        Defaults to ``None`` (no limit).
+
+    :type dry_run: :py:class:`bool`
+    :param dry_run: (Optional) if true, the query is validated and its cost
+        estimated, but not run (and not billed). Defaults to ``False``.
+
+    :type params: :py:class:`dict` OR :py:class:`list`
+    :param params: (Optional) named query parameters, referenced in the
+        query as ``@name``. See :func:`~bibtutils.gcp.bigquery.query`.
+        Defaults to ``None``.
+
+    :rtype: :py:class:`list` OR :py:class:`dict`
+    :returns: a list of dicts, one row in the result table per dict. If
+        ``dry_run`` is ``True``, a dict of the form
+        ``{'total_bytes_processed': <int>}``.
+    """
+    loop = asyncio.get_running_loop()
+    _LOGGER.debug("Sending query: %s", query)
+    bq_client = _get_client(query_project, credentials)
+    job_config = _query_job_config(
+        use_query_cache, maximum_bytes_billed, dry_run, params
+    )
+    _LOGGER.info("Querying BQ...")
+    query_job = await loop.run_in_executor(
+        None, functools.partial(bq_client.query, query, job_config=job_config)
+    )
+    if dry_run:
+        return _dry_run_result(query_job)
+    return await loop.run_in_executor(
+        None, lambda: _results_to_json(query_job.result())
+    )
+
+
+def query_many(
+    queries,
+    query_project=None,
+    credentials=None,
+    max_workers=8,
+    use_query_cache=True,
+    maximum_bytes_billed=None,
+    dry_run=False,
+    params=None,
+):
+    """
+    Sends several independent queries to BQ and returns each result
+    as a list of dicts. All jobs are submitted up front; waiting on
+    and downloading their results then happens in parallel, so the
+    total runtime approaches that of the slowest query rather than
+    the sum of all of them. The same permissions as
+    :func:`~bibtutils.gcp.bigquery.query` apply.
+
+    .. code:: python
+
+        from bibtutils.gcp.bigquery import query_many
+        blue, red = query_many(
+            [
+                'select name from `my_project.my_dataset.my_table` '
+                'where favorite_color="blue"',
+                'select name from `my_project.my_dataset.my_table` '
+                'where favorite_color="red"',
+            ]
+        )
+
+    :type queries: :py:class:`list`
+    :param queries: a list of full BQ queries.
+
+    :type query_project: :py:class:`str`
+    :param query_project: the ID of the project in which to run the queries.
+        If not specified, defaults to the environment's credential's project.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if
+        not to use the account running the function for authentication.
+
+    :type max_workers: :py:class:`int`
+    :param max_workers: (Optional) the maximum number of results to await
+        concurrently. Defaults to ``8``.
+
+    :type use_query_cache: :py:class:`bool`
+    :param use_query_cache: (Optional) whether or not to look for the result
+        in BQ's query cache. Defaults to ``True``.
+
+    :type maximum_bytes_billed: :py:class:`int`
+    :param maximum_bytes_billed: (Optional) fail the query (without
+        incurring a charge) if it would bill more than this many bytes.
+        Defaults to ``None`` (no limit).
+
+    :type dry_run: :py:class:`bool`
+    :param dry_run: (Optional) if true, each query is validated and its cost
+        estimated, but not run (and not billed). Defaults to ``False``.
+
+    :type params: :py:class:`dict` OR :py:class:`list`
+    :param params: (Optional) named query parameters, shared by all
+        queries and referenced in them as ``@name``. See :func:`~bibtutils.gcp.bigquery.query`.
+        Defaults to ``None``.
+
+    :rtype: :py:class:`list`
+    :returns: a list with one entry per query, in the order given, each
+        being a list of dicts (one row in the result table per dict). If
+        ``dry_run`` is ``True``, each entry is instead a dict of the form
+        ``{'total_bytes_processed': <int>}``.
+    """
+    bq_client = _get_client(query_project, credentials)
+    job_config = _query_job_config(
+        use_query_cache, maximum_bytes_billed, dry_run, params
+    )
+    _LOGGER.info("Submitting %s queries to BQ...", len(queries))
+    jobs = [bq_client.query(q, job_config=job_config) for q in queries]
+    if dry_run:
+        return [_dry_run_result(job) for job in jobs]
+    _LOGGER.info("Awaiting query results...")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(
+                lambda job: _results_to_json(job.result()),
+                jobs,
+            )
+        )
+    _LOGGER.info("Returning results as lists of dicts.")
+    return results
+
+
+def _query_job_config(
+    use_query_cache=True, maximum_bytes_billed=None, dry_run=False, params=None
+):
+    """
+    Helper method to build the job config shared by the query functions.
+
+    :type use_query_cache: :py:class:`bool`
+    :param use_query_cache: (Optional) whether or not to look for the result
+        in BQ's query cache. Defaults to ``True``.
+
+    :type maximum_bytes_billed: :py:class:`int`
+    :param maximum_bytes_billed: (Optional) the maximum number of bytes the
+        query may bill. Defaults to ``None`` (no limit).
+
+    :type dry_run: :py:class:`bool`
+    :param dry_run: (Optional) whether to only validate the query and
+        estimate its cost. Defaults to ``False``.
+
+    :type params: :py:class:`dict` OR :py:class:`list`
+    :param params: (Optional) named query parameters. Defaults to ``None``.
+
+    :rtype: :py:class:`gcp_bigquery:google.cloud.bigquery.job.QueryJobConfig`
+    :returns: the query job config.
+    """
+    return bigquery.QueryJobConfig(
+        use_query_cache=use_query_cache,
+        maximum_bytes_billed=maximum_bytes_billed,
+        dry_run=dry_run,
+        query_parameters=_query_parameters(params),
+    )
+
+
+def _dry_run_result(query_job):
+    """
+    Helper method to summarize a dry-run query job.
+
+    :type query_job: :py:class:`gcp_bigquery:google.cloud.bigquery.job.QueryJob`
+    :param query_job: the dry-run query job.
+
+    :rtype: :py:class:`dict`
+    :returns: a dict of the form ``{'total_bytes_processed': <int>}``.
+    """
+    _LOGGER.info(
+        "Dry run complete: query would process %s bytes.",
+        query_job.total_bytes_processed,
+    )
+    return {"total_bytes_processed": query_job.total_bytes_processed}
+
+
+def _query_parameters(params):
+    """
+    Helper method to convert query parameters to the list of query
+    parameter objects expected by the BQ API.
+
+    :type params: :py:class:`dict` OR :py:class:`list`
+    :param params: a dict of parameter names to values, or a list of query
+        parameter objects (which is returned as-is).
+
+    :rtype: :py:class:`list`
+    :returns: a list of query parameter objects.
+    """
+    if not params:
+        return []
+    if not isinstance(params, dict):
+        return list(params)
+    query_params = []
+    for name, value in params.items():
+        if isinstance(value, (list, tuple)):
+            param_type = _PARAM_TYPES.get(type(value[0])) if value else "STRING"
+            if param_type is None:
+                raise ValueError(f"Unsupported query parameter type for: {name}")
+            query_params.append(
+                bigquery.ArrayQueryParameter(name, param_type, list(value))
+            )
+        else:
+            param_type = _PARAM_TYPES.get(type(value))
+            if param_type is None:
+                raise ValueError(f"Unsupported query parameter type for: {name}")
+            query_params.append(bigquery.ScalarQueryParameter(name, param_type, value))
+    return query_params
+
+
+def _results_to_arrow(results, bqstorage_client=None):
+    """
+    Helper method to download a BQ query result as an Arrow table. The
+    Storage API is only used if a client is given; if the caller lacks
+    permission to create read sessions, the REST API is used instead.
+
+    :type results: :py:class:`gcp_bigquery:google.cloud.bigquery.table.RowIterator`
+    :param results: the result of a query job.
+
+    :type bqstorage_client: :py:class:`gcp_bigquery_storage:google.cloud.bigquery_storage_v1.BigQueryReadClient`
+    :param bqstorage_client: (Optional) a BigQuery Storage API client to
+        download the result with.
+
+    :rtype: :py:class:`pyarrow.Table`
+    :returns: the result table.
+    """
+    if bqstorage_client is not None:
+        try:
+            return results.to_arrow(bqstorage_client=bqstorage_client)
+        except (google_exceptions.PermissionDenied, google_exceptions.Forbidden) as e:
+            _LOGGER.warning(
+                "Could not read results via the BigQuery Storage API, "
+                "falling back to the REST API: %s",
+                e,
+            )
+    return results.to_arrow(create_bqstorage_client=False)
+
+
+def _results_to_json(results, bqstorage_client=None):
+    """
+    Helper method to convert a BQ query result into a list of dicts.
+    Large results are converted via Arrow if a Storage API client is given
+    and ``pyarrow`` is installed.
+
+    :type results: :py:class:`gcp_bigquery:google.cloud.bigquery.table.RowIterator`
+    :param results: the result of a query job.
+
+    :type bqstorage_client: :py:class:`gcp_bigquery_storage:google.cloud.bigquery_storage_v1.BigQueryReadClient`
+    :param bqstorage_client: (Optional) a BigQuery Storage API client to use
+        when downloading large results via Arrow. If not specified, rows
+        are downloaded one page at a time via the REST API.
 
     :rtype: :py:class:`list`
     :returns: a list of dicts, one row in the result table per dict.
     """
-    _LOGGER.debug(f"Sending query: {query}")
-    bq_client = bigquery.Client(project=query_project, credentials=credentials)
-    _LOGGER.info("Querying BQ...")
-    query_job = bq_client.query(query)
-    if not await_result:
-        _LOGGER.debug("Not waiting for result of query, returning None.")
-        return None
-    results = query_job.result()
+    if (
+        bqstorage_client is not None
+        and (results.total_rows or 0) > _ARROW_MIN_ROWS
+        and _pyarrow_available()
+    ):
+        _LOGGER.info("Converting result rows via Arrow...")
+        try:
+            return results.to_arrow(bqstorage_client=bqstorage_client).to_pylist()
+        except (google_exceptions.PermissionDenied, google_exceptions.Forbidden) as e:
+            _LOGGER.warning(
+                "Could not read results via the BigQuery Storage API, "
+                "falling back to the REST API: %s",
+                e,
+            )
     _LOGGER.info("Iterating over result rows...")
-    results_json = []
+    field_names = [field.name for field in results.schema]
+    dict_ = dict
+    zip_ = zip
+    return [dict_(zip_(field_names, row.values())) for row in results]
+
+
+def _iter_rows(results):
+    """
+    Helper method to yield the rows of a BQ query result as dicts.
+
+    :type results: :py:class:`gcp_bigquery:google.cloud.bigquery.table.RowIterator`
+    :param results: the result of a query job.
+
+    :rtype: :py:class:`generator`
+    :returns: a generator of dicts, one row in the result table per dict.
+    """
+    field_names = [field.name for field in results.schema]
+    # Local aliases avoid a global lookup per row.
+    dict_ = dict
+    zip_ = zip
     for row in results:
-        results_json.append(dict(row.items()))
-    _LOGGER.info("Returning results as list of dicts.")
-    return results_json
+        yield dict_(zip_(field_names, row.values()))
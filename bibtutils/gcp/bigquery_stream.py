@@ -0,0 +1,321 @@
+"""
+bibtutils.gcp.bigquery_stream
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Functionality making use of GCP's BigQuery Storage Write API, for streaming
+rows into BigQuery tables with much lower latency than load jobs.
+
+See the official BigQuery Storage Python Client documentation here:
+`link <https://cloud.google.com/python/docs/reference/bigquerystorage/latest>`_.
+
+"""
+import datetime
+import functools
+import logging
+from warnings import warn
+
+from dateutil.parser import isoparse
+from google.cloud import bigquery_storage_v1
+from google.cloud.bigquery_storage_v1 import types
+from google.cloud.bigquery_storage_v1 import writer
+from google.protobuf import descriptor_pb2
+from google.protobuf import descriptor_pool
+from google.protobuf import message_factory
+
+from bibtutils.gcp.bigquery import _get_schema
+
+warn(
+    "This library is deprecated. Please use a supported library: "
+    "https://broadinstitute.github.io/bibt-libraries/",
+    DeprecationWarning,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# AppendRows requests are limited to 10MB; leave headroom for request framing.
+_MAX_REQUEST_BYTES = 9 * 1024 * 1024
+
+_FieldDescriptorProto = descriptor_pb2.FieldDescriptorProto
+
+# Proto types accepted by the Storage Write API for each BigQuery type.
+# TIMESTAMP is sent as microseconds and DATE as days since the epoch.
+_PROTO_TYPES = {
+    "STRING": _FieldDescriptorProto.TYPE_STRING,
+    "BYTES": _FieldDescriptorProto.TYPE_BYTES,
+    "INTEGER": _FieldDescriptorProto.TYPE_INT64,
+    "INT64": _FieldDescriptorProto.TYPE_INT64,
+    "FLOAT": _FieldDescriptorProto.TYPE_DOUBLE,
+    "FLOAT64": _FieldDescriptorProto.TYPE_DOUBLE,
+    "BOOLEAN": _FieldDescriptorProto.TYPE_BOOL,
+    "BOOL": _FieldDescriptorProto.TYPE_BOOL,
+    "NUMERIC": _FieldDescriptorProto.TYPE_STRING,
+    "BIGNUMERIC": _FieldDescriptorProto.TYPE_STRING,
+    "TIMESTAMP": _FieldDescriptorProto.TYPE_INT64,
+    "DATE": _FieldDescriptorProto.TYPE_INT32,
+    "DATETIME": _FieldDescriptorProto.TYPE_STRING,
+    "TIME": _FieldDescriptorProto.TYPE_STRING,
+    "GEOGRAPHY": _FieldDescriptorProto.TYPE_STRING,
+    "JSON": _FieldDescriptorProto.TYPE_STRING,
+}
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_write_client(credentials=None):
+    """
+    Helper method to return a cached Storage Write API client, so that
+    every stream shares the same gRPC channel.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if
+        not to use the account running the function for authentication.
+
+    :rtype: :py:class:`google.cloud.bigquery_storage_v1.BigQueryWriteClient`
+    :returns: a Storage Write API client.
+    """
+    return bigquery_storage_v1.BigQueryWriteClient(credentials=credentials)
+
+
+def _descriptor_proto(schema, name):
+    """
+    Helper method to build a protobuf message descriptor matching a
+    BigQuery schema. ``RECORD`` columns become nested message types.
+
+    :type schema: :py:class:`tuple`
+    :param schema: the table's
+        :py:class:`gcp_bigquery:google.cloud.bigquery.SchemaFields`.
+
+    :type name: :py:class:`str`
+    :param name: the name of the message type to build.
+
+    :rtype: :py:class:`google.protobuf.descriptor_pb2.DescriptorProto`
+    :returns: the message descriptor.
+    """
+    proto = descriptor_pb2.DescriptorProto(name=name)
+    for number, field in enumerate(schema, start=1):
+        field_proto = proto.field.add(name=field.name, number=number)
+        if field.mode == "REPEATED":
+            field_proto.label = _FieldDescriptorProto.LABEL_REPEATED
+        else:
+            field_proto.label = _FieldDescriptorProto.LABEL_OPTIONAL
+        if field.field_type in ("RECORD", "STRUCT"):
+            nested_name = f"{name}_{field.name}"
+            proto.nested_type.append(_descriptor_proto(field.fields, nested_name))
+            field_proto.type = _FieldDescriptorProto.TYPE_MESSAGE
+            field_proto.type_name = nested_name
+        else:
+            field_proto.type = _PROTO_TYPES[field.field_type]
+    return proto
+
+
+@functools.lru_cache(maxsize=64)
+def _row_message(schema):
+    """
+    Helper method to return the descriptor and generated message class
+    used to serialize rows for a table with the given schema.
+
+    :type schema: :py:class:`tuple`
+    :param schema: the table's
+        :py:class:`gcp_bigquery:google.cloud.bigquery.SchemaFields`.
+
+    :rtype: :py:class:`tuple`
+    :returns: the :py:class:`google.protobuf.descriptor_pb2.DescriptorProto`
+        and the message class built from it.
+    """
+    descriptor = _descriptor_proto(schema, "Row")
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name="bibtutils_stream_row.proto", syntax="proto2"
+    )
+    file_proto.message_type.append(descriptor)
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    message_class = message_factory.GetMessageClass(pool.FindMessageTypeByName("Row"))
+    return descriptor, message_class
+
+
+def _to_proto_value(value, field_type):
+    """
+    Helper method to convert a Python value to the representation the
+    Storage Write API expects for a column of the given BigQuery type.
+    ``TIMESTAMP`` and ``DATE`` values may be datetime objects or ISO 8601
+    strings.
+    """
+    if field_type == "TIMESTAMP":
+        if isinstance(value, str):
+            try:
+                value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                value = isoparse(value)
+        if isinstance(value, datetime.datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=datetime.timezone.utc)
+            return (value - _EPOCH) // datetime.timedelta(microseconds=1)
+    elif field_type == "DATE":
+        if isinstance(value, str):
+            value = datetime.date.fromisoformat(value)
+        if isinstance(value, datetime.datetime):
+            value = value.date()
+        if isinstance(value, datetime.date):
+            return (value - _EPOCH.date()).days
+    return value
+
+
+def _fill_message(message, row, schema):
+    """
+    Helper method to copy a row (dict) into a protobuf message, recursing
+    into nested records. Keys with ``None`` values are left unset (NULL).
+    Raises :py:exc:`ValueError` for keys that are not in the schema.
+    """
+    fields = message.DESCRIPTOR.fields_by_name
+    schema_fields = {field.name: field for field in schema}
+    for key, value in row.items():
+        if value is None:
+            continue
+        if key not in fields:
+            raise ValueError(f"Column not found in table schema: {key}")
+        field = fields[key]
+        schema_field = schema_fields[key]
+        repeated = field.label == field.LABEL_REPEATED
+        if field.message_type is not None:
+            if repeated:
+                target = getattr(message, key)
+                for item in value:
+                    _fill_message(target.add(), item, schema_field.fields)
+            else:
+                _fill_message(getattr(message, key), value, schema_field.fields)
+        elif repeated:
+            getattr(message, key).extend(
+                _to_proto_value(item, schema_field.field_type) for item in value
+            )
+        else:
+            setattr(message, key, _to_proto_value(value, schema_field.field_type))
+
+
+def _unknown_columns(schema, rows):
+    """
+    Helper method to return the (top-level) keys used in the given rows
+    which are not columns in the schema.
+    """
+    columns = {field.name for field in schema}
+    unknown = set()
+    for row in rows:
+        unknown.update(key for key in row if key not in columns)
+    return unknown
+
+
+def stream_rows(bq_project, dataset, table, rows, credentials=None):
+    """
+    Streams rows into a BigQuery table via the Storage Write API's default
+    stream. Rows are visible for querying as soon as this returns.
+
+    Compared to :func:`~bibtutils.gcp.bigquery.upload_gcs_json`, there is
+    no GCS staging step, no per-job scheduling latency, and no daily load
+    job quota, which makes this better suited to frequent small batches.
+    Note that the Storage Write API is billed per byte ingested, whereas
+    load jobs are free; for large, infrequent batches prefer load jobs.
+
+    Executing account must have edit permissions on the table. Rows are
+    dicts keyed by column name; ``TIMESTAMP`` and ``DATE`` values may be
+    given as :class:`datetime.datetime` and :class:`datetime.date` or as
+    ISO 8601 strings, and naive datetimes are treated as UTC. ``NUMERIC``,
+    ``DATETIME``, ``TIME``, ``GEOGRAPHY`` and ``JSON`` values must be given
+    as strings. If a row has a column missing from the cached table schema,
+    the schema is fetched again once; columns still missing raise
+    :py:class:`ValueError`.
+
+    .. code:: python
+
+        from bibtutils.gcp.bigquery_stream import stream_rows
+        stream_rows(
+            'my_project',
+            'my_dataset',
+            'my_table',
+            [
+                {'name': 'leo', 'favorite_color': 'red'},
+                {'name': 'matthew', 'favorite_color': 'blue'}
+            ]
+        )
+
+    :type bq_project: :py:class:`str`
+    :param bq_project: the project hosting the specified BQ dataset.
+
+    :type dataset: :py:class:`str`
+    :param dataset: the dataset hosting the specified table.
+
+    :type table: :py:class:`str`
+    :param table: the table to which to stream the rows.
+
+    :type rows: :py:class:`list`
+    :param rows: the rows to write, as a list of dicts.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if
+        not to use the account running the function for authentication.
+    """
+    schema = _get_schema(bq_project, dataset, table, credentials=credentials)
+    if _unknown_columns(schema, rows):
+        _LOGGER.info("Rows have columns not in cached schema, refreshing schema.")
+        schema = _get_schema(
+            bq_project, dataset, table, credentials=credentials, refresh=True
+        )
+        unknown = _unknown_columns(schema, rows)
+        if unknown:
+            raise ValueError(
+                f"Columns not found in {bq_project}.{dataset}.{table}: "
+                f"{', '.join(sorted(unknown))}"
+            )
+    descriptor, message_class = _row_message(tuple(schema))
+    client = _get_write_client(credentials)
+
+    request_template = types.AppendRowsRequest()
+    request_template.write_stream = (
+        f"{client.table_path(bq_project, dataset, table)}/streams/_default"
+    )
+    proto_data = types.AppendRowsRequest.ProtoData()
+    proto_data.writer_schema = types.ProtoSchema(proto_descriptor=descriptor)
+    request_template.proto_rows = proto_data
+
+    _LOGGER.info(
+        "Streaming %s rows to %s.%s.%s...", len(rows), bq_project, dataset, table
+    )
+    append_rows_stream = writer.AppendRowsStream(client, request_template)
+    try:
+        futures = []
+        batch = []
+        batch_bytes = 0
+        for row in rows:
+            message = message_class()
+            _fill_message(message, row, schema)
+            serialized = message.SerializeToString()
+            if batch and batch_bytes + len(serialized) > _MAX_REQUEST_BYTES:
+                futures.append(append_rows_stream.send(_append_request(batch)))
+                batch = []
+                batch_bytes = 0
+            batch.append(serialized)
+            batch_bytes += len(serialized)
+        if batch:
+            futures.append(append_rows_stream.send(_append_request(batch)))
+        for future in futures:
+            future.result()
+    finally:
+        append_rows_stream.close()
+    _LOGGER.info("Streaming complete.")
+    return
+
+
+def _append_request(serialized_rows):
+    """
+    Helper method to wrap a batch of serialized rows in an append request.
+
+    :type serialized_rows: :py:class:`list`
+    :param serialized_rows: the serialized row messages.
+
+    :rtype: :py:class:`google.cloud.bigquery_storage_v1.types.AppendRowsRequest`
+    :returns: the append request.
+    """
+    proto_data = types.AppendRowsRequest.ProtoData()
+    proto_data.rows = types.ProtoRows(serialized_rows=serialized_rows)
+    request = types.AppendRowsRequest()
+    request.proto_rows = proto_data
+    return request
@@ -1,4 +1,8 @@
+import datetime
+import functools
 import logging
+import threading
+import time
 from warnings import warn
 
 from google.api_core import exceptions as google_exceptions
@@ -12,13 +16,41 @@ warn(
 )
 _LOGGER = logging.getLogger(__name__)
 
+# Cached tokens are refreshed this many seconds before they expire. This is
+# more than google-auth's own refresh threshold (3m45s), so credentials built
+# from a cached token never consider it already expired.
+_TOKEN_EXPIRY_MARGIN_SECS = 300
+# Used if the API response does not include an expiry time.
+_TOKEN_DEFAULT_LIFETIME_SECS = 3300
 
-def get_access_token(acct, scopes=["https://www.googleapis.com/auth/cloud-platform"]):
+_TOKEN_CACHE = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_iam_client():
+    """
+    Helper method to return a cached IAM Credentials client, so that
+    repeated token requests reuse the same gRPC channel.
+
+    :rtype: :py:class:`google.cloud.iam_credentials.IAMCredentialsClient`
+    :returns: an IAM Credentials client.
+    """
+    return iam_credentials.IAMCredentialsClient()
+
+
+def get_access_token(
+    acct, scopes=["https://www.googleapis.com/auth/cloud-platform"], client=None
+):
     """
     Generates an access token for a target service account which may be used
     to impersonate that service account in API calls. Requires the calling account
     have the "Service Account Token Creator" role on the target account.
 
+    Tokens are cached in memory per account and scopes, and reused until
+    five minutes before they expire. If ``client`` is given, the cache is
+    bypassed, since the client may authenticate as a different identity.
+
     .. code:: python
 
         from bibtutils.gcp import iam
@@ -39,12 +71,35 @@ def get_access_token(acct, scopes=["https://www.googleapis.com/auth/cloud-platfo
         to ``["https://www.googleapis.com/auth/cloud-platform"]`` which
         should be sufficient for most uses cases.
 
+    :type client: :py:class:`google.cloud.iam_credentials.IAMCredentialsClient`
+    :param client: (Optional) an existing IAM Credentials client to use. If
+        not specified, a cached client is used.
+
     :rtype: :py:class:`str`
     :returns: an access token with can be used to generate credentials for Google APIs.
     """
+    return _get_token(acct, scopes, client)[0]
+
+
+def _get_token(acct, scopes, client=None):
+    """
+    Helper method backing :func:`~bibtutils.gcp.iam.get_access_token`;
+    returns the token along with its expiry time (as a POSIX timestamp).
+    Tokens generated with a caller-supplied ``client`` are neither read
+    from nor stored in the cache.
+    """
+    key = (acct, tuple(sorted(scopes)))
+    if client is None:
+        with _TOKEN_CACHE_LOCK:
+            cached = _TOKEN_CACHE.get(key)
+        if cached and time.time() < cached[1] - _TOKEN_EXPIRY_MARGIN_SECS:
+            _LOGGER.info(f"Returning cached access token for account: [{acct}]")
+            return cached
+
     # Create credentials for Logging API at the org level
     _LOGGER.info(f"Getting access token for account: [{acct}] with scope: [{scopes}]")
-    client = iam_credentials.IAMCredentialsClient()
+    use_cache = client is None
+    client = client or _get_iam_client()
     try:
         resp = client.generate_access_token(
             name=acct,
@@ -58,8 +113,16 @@ def get_access_token(acct, scopes=["https://www.googleapis.com/auth/cloud-platfo
         )
         raise e
 
+    if resp.expire_time:
+        expiry = resp.expire_time.timestamp()
+    else:
+        expiry = time.time() + _TOKEN_DEFAULT_LIFETIME_SECS
+    if use_cache:
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE[key] = (resp.access_token, expiry)
+
     _LOGGER.info("Returning access token.")
-    return resp.access_token
+    return resp.access_token, expiry
 
 
 def get_credentials(acct, scopes=["https://www.googleapis.com/auth/cloud-platform"]):
@@ -67,7 +130,8 @@ def get_credentials(acct, scopes=["https://www.googleapis.com/auth/cloud-platfor
     Generates a credentials object for a target service account which may be used
     to impersonate that service account in API calls. Requires the calling account
     have the "Service Account Token Creator" role on the target account. This version
-    takes care of credentials object creation for you.
+    takes care of credentials object creation for you. The credentials carry the
+    token's expiry and fetch a new token when it nears expiry.
 
     .. code:: python
 
@@ -91,7 +155,27 @@ def get_credentials(acct, scopes=["https://www.googleapis.com/auth/cloud-platfor
     :rtype: :py:class:`google_auth:google.oauth2.credentials.Credentials`
     :returns: a credentials object with can be used for authentication with Google APIs.
     """
-    access_token = get_access_token(acct=acct, scopes=scopes)
+    token_scopes = scopes
+
+    def refresh_handler(request, scopes=None):
+        access_token, expiry = _get_token(acct, token_scopes)
+        return access_token, _utc_datetime(expiry)
+
+    access_token, expiry = _get_token(acct, token_scopes)
 
     _LOGGER.info("Generating and returning credentials object.")
-    return credentials.Credentials(token=access_token)
+    return credentials.Credentials(
+        token=access_token,
+        expiry=_utc_datetime(expiry),
+        refresh_handler=refresh_handler,
+    )
+
+
+def _utc_datetime(timestamp):
+    """
+    Helper method to convert a POSIX timestamp to the naive UTC datetime
+    google-auth uses for credential expiry times.
+    """
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).replace(
+        tzinfo=None
+    )
@@ -7,11 +7,23 @@ Functionality making use of GCP's Secret Manager.
 See the official Secret Manager Python Client documentation here: `link <https://googleapis.dev/python/secretmanager/latest/index.html>`_.
 
 """
+import asyncio
+import functools
 import json
 import logging
+import threading
+import time
 from warnings import warn
 
-from google.cloud import secretmanager
+from google.api_core import exceptions as google_exceptions
+from google.api_core import gapic_v1
+from google.api_core import retry
+from google.api_core import retry_async
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 warn(
     "This library is deprecated. Please use a supported library: "
@@ -20,6 +32,75 @@ warn(
 )
 _LOGGER = logging.getLogger(__name__)
 
+# Fetched secret values, keyed by (secret_uri, credentials), with the times
+# at which they were fetched and expire. Only populated when callers opt in
+# with ``cache_secs``; at most _SECRET_CACHE_MAXSIZE values are kept.
+_SECRET_CACHE = {}
+_SECRET_CACHE_LOCK = threading.Lock()
+_SECRET_CACHE_MAXSIZE = 64
+
+# If the caller gives a timeout, the client's default retry policy (which
+# retries for up to 60 seconds) is replaced with one that gives up within the
+# timeout. The errors retried and the backoff match the client's defaults.
+_SECRET_RETRY_PREDICATE = retry.if_exception_type(
+    google_exceptions.ResourceExhausted, google_exceptions.ServiceUnavailable
+)
+_SECRET_RETRY = retry.Retry(
+    predicate=_SECRET_RETRY_PREDICATE, initial=2.0, maximum=60.0, multiplier=2.0
+)
+_SECRET_RETRY_ASYNC = retry_async.AsyncRetry(
+    predicate=_SECRET_RETRY_PREDICATE, initial=2.0, maximum=60.0, multiplier=2.0
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_client(credentials=None):
+    """
+    Helper method to return a cached Secret Manager client, so that
+    fetching several secrets reuses one gRPC channel instead of setting up
+    a new one on every call. ``secretmanager`` is imported on first use
+    rather than with this module, to keep it off the cold-start path of
+    Cloud Functions which never read a secret.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if not to
+        use the account running the function for authentication.
+
+    :rtype: :py:class:`gcp_secretmanager:google.cloud.secretmanager_v1.SecretManagerServiceClient`
+    :returns: a Secret Manager client.
+    """
+    from google.cloud import secretmanager
+
+    _LOGGER.debug("Creating Secret Manager client.")
+    return secretmanager.SecretManagerServiceClient(credentials=credentials)
+
+
+def prewarm_client(credentials=None):
+    """
+    Starts creating the cached Secret Manager client on a background daemon thread,
+    so that the credential discovery and connection setup it involves
+    overlap with the caller's own startup work instead of delaying the
+    first secret fetch call. Intended to be called once, early in a
+    long-running application's startup.
+
+    .. code:: python
+
+        from bibtutils.gcp.secrets import prewarm_client
+        prewarm_client()
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if not to
+        use the account running the function for authentication. Must be the
+        same object later passed to this module's functions for the client
+        to be reused.
+
+    :rtype: :py:class:`threading.Thread`
+    :returns: the started thread, which may be joined to wait for the client.
+    """
+    thread = threading.Thread(target=_get_client, args=(credentials,), daemon=True)
+    thread.start()
+    return thread
+
 
 def get_secret(host_project, secret_name, **kwargs):
     """
@@ -66,7 +147,10 @@ def get_secret_json(host_project, secret_name, **kwargs):
     :rtype: :py:class:`dict`
     :returns: the secret data.
     """
-    secret = get_secret_by_name(host_project, secret_name, decode=True, **kwargs)
+    # Both parsers accept UTF-8 bytes, so skip decoding to str first.
+    secret = get_secret_by_name(host_project, secret_name, decode=False, **kwargs)
+    if orjson is not None:
+        return orjson.loads(secret)
     return json.loads(secret)
 
 
@@ -101,13 +185,20 @@ def get_secret_by_name(host_project, secret_name, **kwargs):
     return get_secret_by_uri(secret_uri, **kwargs)
 
 
-def get_secret_by_uri(secret_uri, decode=True, credentials=None, timeout=None):
+def get_secret_by_uri(
+    secret_uri, decode=True, credentials=None, timeout=None, cache_secs=0
+):
     """
     Gets a secret from GCP and returns it either as decoded
     utf-8 or raw bytes (depending on ``decode`` parameter).
     Executing account must have (at least) secret version
     accessor permissions on the secret.
 
+    If ``cache_secs`` is set, fetched values are reused in-process for that
+    many seconds, so repeatedly reading the same secret costs a single API
+    call. Use :func:`~bibtutils.gcp.secrets.invalidate_secret` after
+    rotating a secret to force the next call to fetch it again.
+
     .. code:: python
 
         from bibtutils.gcp.secrets import get_secret_by_uri
@@ -129,16 +220,211 @@ def get_secret_by_uri(secret_uri, decode=True, credentials=None, timeout=None):
         use the account running the function for authentication.
 
     :type timeout: :py:class:`float`
-    :param timeout: request timeout may be specified if desired.
+    :param timeout: request timeout may be specified if desired. Transient
+        errors are retried with backoff within this timeout (or for up to 60
+        seconds, the client's default, if not specified).
+
+    :type cache_secs: :py:class:`int`
+    :param cache_secs: (Optional) the number of seconds for which a fetched
+        value may be reused. Defaults to ``0`` (always fetch the secret).
 
     :rtype: :py:class:`bytes` OR :py:class:`str`
     :returns: the secret data.
     """
-    _LOGGER.info(f"Getting secret: {secret_uri}")
-    client = secretmanager.SecretManagerServiceClient(credentials=credentials)
-    secret = client.access_secret_version(
-        request={"name": secret_uri}, timeout=timeout
-    ).payload.data
+    key = (secret_uri, credentials)
+    with _SECRET_CACHE_LOCK:
+        cached = _SECRET_CACHE.get(key)
+    if cached and time.monotonic() - cached[1] < cache_secs:
+        _LOGGER.info("Returning cached secret: %s", secret_uri)
+        secret = cached[0]
+    else:
+        _LOGGER.info("Getting secret: %s", secret_uri)
+        client = _get_client(credentials)
+        retry_policy = (
+            _SECRET_RETRY.with_deadline(timeout) if timeout else gapic_v1.method.DEFAULT
+        )
+        secret = client.access_secret_version(
+            request={"name": secret_uri}, timeout=timeout, retry=retry_policy
+        ).payload.data
+        if cache_secs:
+            with _SECRET_CACHE_LOCK:
+                _cache_secret(key, secret, cache_secs)
     if decode:
         return secret.decode("utf-8")
     return secret
+
+
+def get_secrets(secret_uris, **kwargs):
+    """
+    Gets several secrets from GCP concurrently, so the total wait is that
+    of the slowest fetch rather than the sum of all of them. The same
+    permissions as :func:`~bibtutils.gcp.secrets.get_secret_by_uri` apply.
+    Any extra arguments (``kwargs``) are passed to the
+    :func:`~bibtutils.gcp.secrets.aget_secrets` coroutine.
+
+    Must not be called from a running event loop; await
+    :func:`~bibtutils.gcp.secrets.aget_secrets` there instead.
+
+    .. code:: python
+
+        from bibtutils.gcp.secrets import get_secrets
+        db_password, api_key = get_secrets(
+            [
+                'projects/my_project/secrets/db_password/versions/latest',
+                'projects/my_project/secrets/api_key/versions/latest',
+            ]
+        )
+
+    :type secret_uris: :py:class:`list`
+    :param secret_uris: the uris of the secrets to fetch. secret uri format:
+        ``'projects/{host_project}/secrets/{secret_name}/versions/latest'``
+
+    :rtype: :py:class:`list`
+    :returns: the secrets' data, in the order given.
+    """
+    return asyncio.run(aget_secrets(secret_uris, **kwargs))
+
+
+async def aget_secrets(
+    secret_uris, decode=True, credentials=None, timeout=None, cache_secs=0
+):
+    """
+    Coroutine which gets several secrets from GCP concurrently. If
+    ``cache_secs`` is set, secrets fetched within the last ``cache_secs``
+    seconds (by this or by :func:`~bibtutils.gcp.secrets.get_secret_by_uri`)
+    are served from the in-process cache; the rest are fetched in parallel
+    on one async client.
+
+    .. code:: python
+
+        import asyncio
+        from bibtutils.gcp.secrets import aget_secrets
+        async def main():
+            return await aget_secrets(
+                [
+                    'projects/my_project/secrets/db_password/versions/latest',
+                    'projects/my_project/secrets/api_key/versions/latest',
+                ]
+            )
+        db_password, api_key = asyncio.run(main())
+
+    :type secret_uris: :py:class:`list`
+    :param secret_uris: the uris of the secrets to fetch.
+
+    :type decode: :py:class:`bool`
+    :param decode: (Optional) whether or not to decode the bytes.
+        Defaults to ``True``.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if not to
+        use the account running the function for authentication.
+
+    :type timeout: :py:class:`float`
+    :param timeout: request timeout may be specified if desired. Transient
+        errors are retried with backoff within this timeout (or for up to 60
+        seconds, the client's default, if not specified).
+
+    :type cache_secs: :py:class:`int`
+    :param cache_secs: (Optional) the number of seconds for which a fetched
+        value may be reused. Defaults to ``0`` (always fetch the secrets).
+
+    :rtype: :py:class:`list`
+    :returns: the secrets' data, in the order given.
+    """
+    from google.cloud import secretmanager
+
+    secrets = {}
+    now = time.monotonic()
+    with _SECRET_CACHE_LOCK:
+        for secret_uri in secret_uris:
+            cached = _SECRET_CACHE.get((secret_uri, credentials))
+            if cached and now - cached[1] < cache_secs:
+                secrets[secret_uri] = cached[0]
+    to_fetch = list(dict.fromkeys(uri for uri in secret_uris if uri not in secrets))
+    if to_fetch:
+        _LOGGER.info("Getting %s secrets...", len(to_fetch))
+        # Async clients are bound to the running event loop, so unlike the
+        # synchronous client this one is not cached across calls.
+        client = secretmanager.SecretManagerServiceAsyncClient(credentials=credentials)
+        retry_policy = (
+            _SECRET_RETRY_ASYNC.with_deadline(timeout)
+            if timeout
+            else gapic_v1.method.DEFAULT
+        )
+        try:
+            responses = await asyncio.gather(
+                *[
+                    client.access_secret_version(
+                        request={"name": secret_uri},
+                        timeout=timeout,
+                        retry=retry_policy,
+                    )
+                    for secret_uri in to_fetch
+                ]
+            )
+        finally:
+            await client.transport.close()
+        for secret_uri, response in zip(to_fetch, responses):
+            secrets[secret_uri] = response.payload.data
+        if cache_secs:
+            with _SECRET_CACHE_LOCK:
+                for secret_uri in to_fetch:
+                    _cache_secret(
+                        (secret_uri, credentials), secrets[secret_uri], cache_secs
+                    )
+    if decode:
+        return [secrets[secret_uri].decode("utf-8") for secret_uri in secret_uris]
+    return [secrets[secret_uri] for secret_uri in secret_uris]
+
+
+def _cache_secret(key, secret, cache_secs):
+    """
+    Helper method to store a fetched secret value in the cache. Expired
+    values are evicted first, then the oldest values if the cache is full.
+    Must be called with ``_SECRET_CACHE_LOCK`` held.
+
+    :type key: :py:class:`tuple`
+    :param key: the ``(secret_uri, credentials)`` cache key.
+
+    :type secret: :py:class:`bytes`
+    :param secret: the secret data.
+
+    :type cache_secs: :py:class:`int`
+    :param cache_secs: the number of seconds for which the value may be
+        reused.
+    """
+    now = time.monotonic()
+    for expired in [k for k, cached in _SECRET_CACHE.items() if cached[2] <= now]:
+        del _SECRET_CACHE[expired]
+    # Re-inserting moves the key to the end, so the dict stays oldest-first.
+    _SECRET_CACHE.pop(key, None)
+    while len(_SECRET_CACHE) >= _SECRET_CACHE_MAXSIZE:
+        del _SECRET_CACHE[next(iter(_SECRET_CACHE))]
+    _SECRET_CACHE[key] = (secret, now, now + cache_secs)
+
+
+def invalidate_secret(secret_uri=None):
+    """
+    Drops cached values fetched by
+    :func:`~bibtutils.gcp.secrets.get_secret_by_uri` or
+    :func:`~bibtutils.gcp.secrets.aget_secrets` with ``cache_secs`` set,
+    e.g. after a secret has been rotated.
+
+    .. code:: python
+
+        from bibtutils.gcp.secrets import invalidate_secret
+        invalidate_secret(
+            'projects/my_project/secrets/my_secret/versions/latest'
+        )
+
+    :type secret_uri: :py:class:`str`
+    :param secret_uri: (Optional) the uri of the secret to drop. If not
+        specified, all cached secrets are dropped. Defaults to ``None``.
+    """
+    with _SECRET_CACHE_LOCK:
+        if secret_uri is None:
+            _SECRET_CACHE.clear()
+        else:
+            for key in [key for key in _SECRET_CACHE if key[0] == secret_uri]:
+                del _SECRET_CACHE[key]
+    return
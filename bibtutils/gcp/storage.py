@@ -7,13 +7,29 @@ Functionality making use of GCP's Cloud Storage.
 See the official Cloud Storage Python Client documentation here: `link <https://googleapis.dev/python/storage/latest/index.html>`_.
 
 """
+import atexit
 import datetime
+import functools
+import gzip
 import json
 import logging
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from warnings import warn
 
+import google.auth.credentials
 from google.api_core import exceptions as google_exceptions
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 warn(
     "This library is deprecated. Please use a supported library: "
@@ -22,6 +38,96 @@ warn(
 )
 _LOGGER = logging.getLogger(__name__)
 
+# Size of each ranged request made when streaming a blob.
+_READ_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Connections kept open per host by each cached client's HTTP session; the
+# requests default of 10 throttles the thread pools used by write_gcs_many
+# and read_gcs_many.
+_HTTP_POOL_SIZE = 50
+
+# Files at least this large are transferred as concurrent chunks by
+# upload_gcs_file and download_gcs_file; smaller files in a single request.
+_PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=8)
+def _get_client(credentials=None):
+    """
+    Helper method to return a cached Cloud Storage client, so repeated
+    calls reuse the same auth session and HTTP connections instead of
+    rebuilding them on every API call.
+
+    The client's HTTP session keeps up to ``_HTTP_POOL_SIZE`` connections
+    open, so that concurrent calls sharing it don't queue for a connection.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if not to
+        use the account running the function for authentication.
+
+    :rtype: :py:class:`gcp_storage:google.cloud.storage.client.Client`
+    :returns: a Cloud Storage client.
+    """
+    _LOGGER.debug("Creating Cloud Storage client.")
+    project = None
+    if credentials is None:
+        credentials, project = google.auth.default(scopes=storage.Client.SCOPE)
+    else:
+        credentials = google.auth.credentials.with_scopes_if_required(
+            credentials, storage.Client.SCOPE
+        )
+    session = AuthorizedSession(credentials)
+    adapter = HTTPAdapter(
+        pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE
+    )
+    session.mount("https://", adapter)
+    # Passing project=None explicitly tells the client not to infer one, so
+    # only pass it if it's known.
+    client_kwargs = {"project": project} if project is not None else {}
+    client = storage.Client(credentials=credentials, _http=session, **client_kwargs)
+    _OPEN_CLIENTS.add(client)
+    return client
+
+
+_OPEN_CLIENTS = weakref.WeakSet()
+
+
+@atexit.register
+def _close_clients():
+    """
+    Helper method to close the HTTP sessions of any cached clients when the
+    interpreter exits.
+    """
+    for client in list(_OPEN_CLIENTS):
+        client.close()
+
+
+def prewarm_client(credentials=None):
+    """
+    Starts creating the cached Cloud Storage client on a background daemon thread,
+    so that the credential discovery and connection setup it involves
+    overlap with the caller's own startup work instead of delaying the
+    first read or write call. Intended to be called once, early in a
+    long-running application's startup.
+
+    .. code:: python
+
+        from bibtutils.gcp.storage import prewarm_client
+        prewarm_client()
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if not to
+        use the account running the function for authentication. Must be the
+        same object later passed to this module's functions for the client
+        to be reused.
+
+    :rtype: :py:class:`threading.Thread`
+    :returns: the started thread, which may be joined to wait for the client.
+    """
+    thread = threading.Thread(target=_get_client, args=(credentials,), daemon=True)
+    thread.start()
+    return thread
+
 
 def create_bucket(project, bucket_name, location="US", credentials=None):
     """
@@ -52,9 +158,9 @@ def create_bucket(project, bucket_name, location="US", credentials=None):
     :returns:  The bucket created during this function call.
     """
     _LOGGER.info(
-        f"Attempting to create bucket: [{bucket_name}] in project: [{project}]"
+        "Attempting to create bucket: [%s] in project: [%s]", bucket_name, project
     )
-    client = storage.Client(credentials=credentials)
+    client = _get_client(credentials)
     bucket = client.bucket(bucket_name)
     try:
         bucket = client.create_bucket(bucket, project=project, location=location)
@@ -63,19 +169,21 @@ def create_bucket(project, bucket_name, location="US", credentials=None):
         google_exceptions.Conflict,
         google_exceptions.BadRequest,
     ) as e:
-        if google_exceptions.Forbidden:
+        if isinstance(e, google_exceptions.Forbidden):
             _LOGGER.error(
                 "Current account does not have required permissions to create "
-                f"buckets in GCP project: [{project}]. Navigate to "
-                f"https://console.cloud.google.com/iam-admin/iam?project={project} "
-                'and add the "Storage Admin" role to the appropriate account.'
+                "buckets in GCP project: [%s]. Navigate to "
+                "https://console.cloud.google.com/iam-admin/iam?project=%s "
+                'and add the "Storage Admin" role to the appropriate account.',
+                project,
+                project,
             )
         raise e
-    _LOGGER.info(f"Bucket: [{bucket.name}] created successfully.")
+    _LOGGER.info("Bucket: [%s] created successfully.", bucket.name)
     return bucket
 
 
-def read_gcs(bucket_name, blob_name, decode=True, credentials=None):
+def read_gcs(bucket_name, blob_name, decode=True, credentials=None, raw_download=False):
     """
     Reads the contents of a blob from GCS. Service account must
     have (at least) read permissions on the bucket/blob.
@@ -103,23 +211,35 @@ def read_gcs(bucket_name, blob_name, decode=True, credentials=None):
     :param credentials: the credentials object to use when making the API call, if not to
         use the account running the function for authentication.
 
+    :type raw_download: :py:class:`bool`
+    :param raw_download: (Optional) if ``True``, the blob is downloaded
+        exactly as stored, skipping decompressive transcoding of
+        gzip-encoded blobs. Defaults to ``False``.
+
     :rtype: :py:class:`str`
     :returns: blob contents, decoded to utf-8.
     """
-    _LOGGER.info(f"Getting gs://{bucket_name}/{blob_name}")
-    client = storage.Client(credentials=credentials)
-    blob = client.get_bucket(bucket_name).get_blob(blob_name)
-    contents = blob.download_as_bytes()
+    _LOGGER.info("Getting gs://%s/%s", bucket_name, blob_name)
+    client = _get_client(credentials)
+    blob = client.bucket(bucket_name).blob(blob_name)
+    contents = blob.download_as_bytes(raw_download=raw_download)
     if decode:
         return contents.decode("utf-8")
     return contents
 
 
-def read_gcs_nldjson(bucket_name, blob_name, **kwargs):
+def read_gcs_nldjson(bucket_name, blob_name, row_factory=None, **kwargs):
     """
     Reads a blob in JSON NLD format from GCS and returns it as a list of dicts.
     Any extra arguments (``kwargs``) are passed to the :func:`~bibtutils.gcp.storage.read_gcs` function.
 
+    For large blobs, ``row_factory`` can be used to hold the rows in a more
+    compact form than one dict per row: either a class (e.g. a
+    :func:`~collections.namedtuple`, or a dataclass with ``slots=True``)
+    which is called with each row's keys as keyword arguments, or
+    ``'columnar'`` to get a single dict of column lists, which can be handed
+    to pandas or pyarrow directly.
+
     .. code:: python
 
         from bibtutils.gcp.storage import read_gcs_nldjson
@@ -132,14 +252,145 @@ def read_gcs_nldjson(bucket_name, blob_name, **kwargs):
     :type blob_name: :py:class:`str`
     :param blob_name: the blob to read from GCS.
 
-    :rtype: :py:class:`list`
-    :returns: the data from the blob, converted into a list of :py:class:`dict`.
+    :type row_factory: :py:class:`type` OR :py:class:`str`
+    :param row_factory: (Optional) a callable to build each row from its
+        keys, or ``'columnar'`` to return the data as a dict mapping each key
+        to a list of values (``None`` where a row lacks the key). Defaults to
+        ``None``, returning a list of :py:class:`dict`.
+
+    :rtype: :py:class:`list` OR :py:class:`dict`
+    :returns: the data from the blob, converted into a list of :py:class:`dict`
+        (or of ``row_factory`` objects), or a :py:class:`dict` of columns.
     """
-    json_nld = read_gcs(bucket_name, blob_name, decode=True, **kwargs)
+    if isinstance(row_factory, str) and row_factory != "columnar":
+        raise ValueError(
+            f"Unsupported row_factory: {row_factory!r}. "
+            "Pass a callable or 'columnar'."
+        )
+    # Both parsers accept UTF-8 bytes, so skip decoding to str first.
+    json_nld = read_gcs(bucket_name, blob_name, decode=False, **kwargs)
     _LOGGER.info("Converting from JSON NLD to JSON...")
-    json_list = "[" + json_nld.replace("\n", ",")
-    json_list = json_list.rstrip(",") + "]"
-    return json.loads(json_list)
+    loads = orjson.loads if orjson is not None else json.loads
+    if row_factory is None:
+        return [loads(line) for line in json_nld.splitlines() if line.strip()]
+    if row_factory == "columnar":
+        rows = [loads(line) for line in json_nld.splitlines() if line.strip()]
+        keys = dict.fromkeys(key for row in rows for key in row)
+        return {key: [row.get(key) for row in rows] for key in keys}
+    return [
+        row_factory(**loads(line)) for line in json_nld.splitlines() if line.strip()
+    ]
+
+
+def read_gcs_many(bucket_name, blob_names, max_workers=32, **kwargs):
+    """
+    Reads several blobs from the same bucket in parallel. Each read is a
+    separate HTTP request, so running them in a bounded thread pool
+    overlaps their latency; all reads share one cached client and its
+    connection pool.
+    Any extra arguments (``kwargs``) are passed to the :func:`~bibtutils.gcp.storage.read_gcs` function.
+
+    .. code:: python
+
+        from bibtutils.gcp.storage import read_gcs_many
+        data = read_gcs_many('my_bucket', ['my_blob_1', 'my_blob_2'])
+        print(data['my_blob_1'])
+
+    :type bucket_name: :py:class:`str`
+    :param bucket_name: the bucket hosting the specified blobs.
+
+    :type blob_names: :py:class:`list`
+    :param blob_names: the blobs to read from GCS.
+
+    :type max_workers: :py:class:`int`
+    :param max_workers: (Optional) the maximum number of blobs to read
+        concurrently. Defaults to ``32``.
+
+    :rtype: :py:class:`dict`
+    :returns: the contents of each blob, keyed by blob name.
+    """
+    _LOGGER.info("Reading %s blobs from gs://%s...", len(blob_names), bucket_name)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            blob_name: executor.submit(read_gcs, bucket_name, blob_name, **kwargs)
+            for blob_name in blob_names
+        }
+        return {blob_name: future.result() for blob_name, future in futures.items()}
+
+
+def read_gcs_iter_lines(bucket_name, blob_name, credentials=None):
+    """
+    Reads a blob in JSON NLD format from GCS, yielding each row as a dict
+    while the blob is downloaded in chunks. Unlike
+    :func:`~bibtutils.gcp.storage.read_gcs_nldjson`, the whole blob is never
+    held in memory, so this is suitable for exports too large to load at
+    once. Service account must have (at least) read permissions on the
+    bucket/blob.
+
+    Blobs stored with ``Content-Encoding: gzip`` (e.g. written by
+    :func:`~bibtutils.gcp.storage.write_gcs_nldjson` with
+    ``compress='gzip'``) are downloaded as stored and decompressed here,
+    since GCS ignores ranged requests for blobs it decompresses itself.
+
+    .. code:: python
+
+        from bibtutils.gcp.storage import read_gcs_iter_lines
+        for item in read_gcs_iter_lines('my_bucket', 'my_nldjson_blob'):
+            print(item['favorite_color'])
+
+    :type bucket_name: :py:class:`str`
+    :param bucket_name: the bucket hosting the specified blob.
+
+    :type blob_name: :py:class:`str`
+    :param blob_name: the blob to read from GCS.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if not to
+        use the account running the function for authentication.
+
+    :rtype: :py:class:`generator`
+    :returns: the rows of the blob, as :py:class:`dict`.
+    """
+    _LOGGER.info("Streaming gs://%s/%s", bucket_name, blob_name)
+    client = _get_client(credentials)
+    blob = client.bucket(bucket_name).blob(blob_name)
+    # Fetches the blob's metadata, for its content encoding.
+    blob.reload()
+    with blob.open("rb", chunk_size=_READ_CHUNK_SIZE, raw_download=True) as reader:
+        if blob.content_encoding == "gzip":
+            with gzip.GzipFile(fileobj=reader, mode="rb") as stream:
+                yield from _iter_json_lines(stream)
+        else:
+            yield from _iter_json_lines(reader)
+
+
+def _iter_json_lines(stream, chunk_size=_READ_CHUNK_SIZE):
+    """
+    Helper method to yield the rows of a JSON NLD stream as dicts, reading
+    it ``chunk_size`` bytes at a time. Lines split across chunks are joined
+    back together, and blank lines are skipped.
+
+    :type stream: :py:class:`io.RawIOBase`
+    :param stream: a binary file-like object to read from.
+
+    :type chunk_size: :py:class:`int`
+    :param chunk_size: (Optional) the number of bytes to read at a time.
+        Defaults to 8 MiB.
+
+    :rtype: :py:class:`generator`
+    :returns: the rows of the stream, as :py:class:`dict`.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    remainder = b""
+    for chunk in iter(functools.partial(stream.read, chunk_size), b""):
+        lines = (remainder + chunk).split(b"\n")
+        # The last piece may be a partial line; carry it into the next chunk.
+        remainder = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield loads(line)
+    if remainder.strip():
+        yield loads(remainder)
 
 
 def write_gcs(
@@ -150,6 +401,9 @@ def write_gcs(
     create_bucket_if_not_found=False,
     timeout=storage.constants._DEFAULT_TIMEOUT,
     credentials=None,
+    content_encoding=None,
+    checksum=None,
+    if_generation_match=None,
 ):
     """
     Writes a String to GCS storage under a given blob name to the given bucket.
@@ -182,24 +436,298 @@ def write_gcs(
     :param content_type: (Optional) the
         `MIME type <https://www.iana.org/assignments/media-types/media-types.xhtml>`_
         being uploaded. defaults to ``'text/plain'``.
+
+    :type content_encoding: :py:class:`str`
+    :param content_encoding: (Optional) the ``Content-Encoding`` of ``data``,
+        e.g. ``'gzip'`` if it has already been compressed. Defaults to ``None``.
+
+    :type checksum: :py:class:`str`
+    :param checksum: (Optional) set to ``'crc32c'`` (or ``'md5'``) to have the
+        upload's integrity verified by GCS. CRC32C is computed by the
+        ``google-crc32c`` C extension and is much cheaper than MD5 on large
+        payloads. Defaults to ``None`` (no verification).
+
+    :type if_generation_match: :py:class:`int`
+    :param if_generation_match: (Optional) only write the blob if its current
+        generation matches this value; ``0`` writes it only if it does not
+        exist yet. GCS enforces this atomically, raising
+        :py:class:`google.api_core.exceptions.PreconditionFailed` otherwise,
+        and it makes the upload safe to retry. Defaults to ``None``
+        (always overwrite).
     """
-    client = storage.Client(credentials=credentials)
-    try:
-        bucket = client.get_bucket(bucket_name)
-    except google_exceptions.NotFound as e:
-        _LOGGER.error(e.message)
-        _LOGGER.info(f"create_bucket_if_not_found=={create_bucket_if_not_found}")
-        if not create_bucket_if_not_found:
-            raise e
-        bucket = create_bucket(client.project, bucket_name)
+    client = _get_client(credentials)
+    # Buckets and blobs are referenced locally; only check that the bucket
+    # exists (an extra API call) if we may need to create it.
+    bucket = client.bucket(bucket_name)
+    if create_bucket_if_not_found and not bucket.exists():
+        _LOGGER.info("Bucket [%s] not found, creating it...", bucket_name)
+        bucket = create_bucket(client.project, bucket_name, credentials=credentials)
     blob = bucket.blob(blob_name)
-    _LOGGER.info(f"Writing to GCS: gs://{bucket_name}/{blob_name}")
-    blob.upload_from_string(data, content_type=mime_type, timeout=timeout)
+    blob.content_encoding = content_encoding
+    _LOGGER.info("Writing to GCS: gs://%s/%s", bucket_name, blob_name)
+    blob.upload_from_string(
+        data,
+        content_type=mime_type,
+        timeout=timeout,
+        checksum=checksum,
+        if_generation_match=if_generation_match,
+    )
     _LOGGER.info("Upload complete.")
     return
 
 
-def write_gcs_nldjson(bucket_name, blob_name, json_data, add_date=False, **kwargs):
+def write_gcs_stream(
+    bucket_name,
+    blob_name,
+    chunks,
+    mime_type="text/plain",
+    chunk_size=_READ_CHUNK_SIZE,
+    credentials=None,
+):
+    """
+    Writes data to GCS from an iterable of chunks, as a resumable upload
+    sent ``chunk_size`` bytes at a time. Only one chunk is buffered at
+    once, so the full payload never needs to be held in memory; use this
+    instead of :func:`~bibtutils.gcp.storage.write_gcs` for data produced
+    incrementally, such as a large export read from another source.
+    The executing account must have (at least) write permissions to the bucket.
+
+    If iterating ``chunks`` raises, the upload is cancelled and the
+    exception re-raised; the blob is left as it was, rather than being
+    overwritten with the data sent so far.
+
+    .. code:: python
+
+        import orjson
+        from bibtutils.gcp.storage import write_gcs_stream
+        write_gcs_stream(
+            'my_bucket',
+            'my_nldjson_blob',
+            (orjson.dumps(row) + b'\\n' for row in generate_rows()),
+            mime_type='application/json',
+        )
+
+    :type bucket_name: :py:class:`str`
+    :param bucket_name: the name of the bucket to which to write.
+
+    :type blob_name: :py:class:`str`
+    :param blob_name: the name of the blob to write.
+
+    :type chunks: :py:class:`iterable`
+    :param chunks: the data to be written, as :py:class:`bytes` (or
+        :py:class:`str`, which will be encoded as utf-8).
+
+    :type mime_type: :py:class:`str`
+    :param mime_type: (Optional) the
+        `MIME type <https://www.iana.org/assignments/media-types/media-types.xhtml>`_
+        being uploaded. Defaults to ``'text/plain'``.
+
+    :type chunk_size: :py:class:`int`
+    :param chunk_size: (Optional) the number of bytes sent per request;
+        must be a multiple of 256 KiB. Defaults to 8 MiB.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if not to
+        use the account running the function for authentication.
+    """
+    client = _get_client(credentials)
+    blob = client.bucket(bucket_name).blob(blob_name)
+    _LOGGER.info("Streaming to GCS: gs://%s/%s", bucket_name, blob_name)
+    # Not a with block: BlobWriter's __exit__ calls close(), which would
+    # finalize (commit) a partial upload if the chunks raise.
+    writer = blob.open("wb", chunk_size=chunk_size, content_type=mime_type)
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            writer.write(chunk)
+    except BaseException:
+        _LOGGER.warning("Cancelling upload to gs://%s/%s.", bucket_name, blob_name)
+        _cancel_upload(writer)
+        raise
+    writer.close()
+    _LOGGER.info("Upload complete.")
+    return
+
+
+def _cancel_upload(writer):
+    """
+    Helper method to abandon a blob writer's upload without finalizing it.
+    If the resumable session has been started, it is cancelled with a
+    DELETE on its session URI. :py:class:`~google.cloud.storage.fileio.BlobWriter`
+    has no public way to do this, so its internals are used.
+
+    :type writer: :py:class:`google.cloud.storage.fileio.BlobWriter`
+    :param writer: the writer whose upload to cancel.
+    """
+    if writer._upload_and_transport is not None:
+        upload, transport = writer._upload_and_transport
+        if upload.resumable_url is not None:
+            try:
+                # GCS answers a cancelled session with 499, so the status
+                # isn't checked.
+                transport.delete(upload.resumable_url, timeout=60)
+            except Exception as e:
+                _LOGGER.warning("Could not cancel resumable upload: %s", e)
+    # Closing the buffer discards any unsent data and marks the writer as
+    # closed, so it isn't finalized when garbage collected either.
+    writer._buffer.close()
+
+
+def write_gcs_many(bucket_name, blobs, max_workers=32, **kwargs):
+    """
+    Writes several blobs to the same bucket in parallel. Each upload is a
+    separate HTTP request, so running them in a bounded thread pool
+    overlaps their latency; all uploads share one cached client and its
+    connection pool.
+    Any extra arguments (``kwargs``) are passed to the :func:`~bibtutils.gcp.storage.write_gcs` function.
+
+    .. code:: python
+
+        from bibtutils.gcp.storage import write_gcs_many
+        write_gcs_many(
+            'my_bucket',
+            {'my_blob_1': 'my favorite color is blue', 'my_blob_2': 'mine is red'},
+        )
+
+    :type bucket_name: :py:class:`str`
+    :param bucket_name: the name of the bucket to which to write.
+
+    :type blobs: :py:class:`dict`
+    :param blobs: the data to be written (:py:class:`str` OR
+        :py:class:`bytes`), keyed by blob name.
+
+    :type max_workers: :py:class:`int`
+    :param max_workers: (Optional) the maximum number of blobs to write
+        concurrently. Defaults to ``32``.
+    """
+    _LOGGER.info("Writing %s blobs to gs://%s...", len(blobs), bucket_name)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(write_gcs, bucket_name, blob_name, data, **kwargs)
+            for blob_name, data in blobs.items()
+        ]
+        for future in futures:
+            future.result()
+    _LOGGER.info("Uploads complete.")
+    return
+
+
+def upload_gcs_file(
+    bucket_name,
+    blob_name,
+    filename,
+    mime_type=None,
+    max_workers=8,
+    credentials=None,
+):
+    """
+    Uploads a local file to GCS. Files of 32 MiB or more are uploaded as
+    concurrent chunks via the XML multipart upload API, which uses much
+    more of the available bandwidth than a single stream; smaller files
+    are uploaded in a single request.
+    The executing account must have (at least) write permissions to the bucket.
+
+    .. code:: python
+
+        from bibtutils.gcp.storage import upload_gcs_file
+        upload_gcs_file('my_bucket', 'my_blob', '/tmp/my_large_export.json')
+
+    :type bucket_name: :py:class:`str`
+    :param bucket_name: the name of the bucket to which to write.
+
+    :type blob_name: :py:class:`str`
+    :param blob_name: the name of the blob to write.
+
+    :type filename: :py:class:`str`
+    :param filename: the path of the file to upload.
+
+    :type mime_type: :py:class:`str`
+    :param mime_type: (Optional) the
+        `MIME type <https://www.iana.org/assignments/media-types/media-types.xhtml>`_
+        being uploaded. Defaults to ``None`` (guessed from ``filename``).
+
+    :type max_workers: :py:class:`int`
+    :param max_workers: (Optional) the maximum number of chunks to upload
+        concurrently. Defaults to ``8``.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if not to
+        use the account running the function for authentication.
+    """
+    client = _get_client(credentials)
+    blob = client.bucket(bucket_name).blob(blob_name)
+    _LOGGER.info("Uploading %s to gs://%s/%s", filename, bucket_name, blob_name)
+    if os.path.getsize(filename) < _PARALLEL_MIN_BYTES:
+        blob.upload_from_filename(filename, content_type=mime_type)
+    else:
+        # Threads share the cached client; process workers would each
+        # unpickle a new one.
+        transfer_manager.upload_chunks_concurrently(
+            filename,
+            blob,
+            content_type=mime_type,
+            worker_type=transfer_manager.THREAD,
+            max_workers=max_workers,
+        )
+    _LOGGER.info("Upload complete.")
+    return
+
+
+def download_gcs_file(
+    bucket_name, blob_name, filename, max_workers=8, credentials=None
+):
+    """
+    Downloads a blob from GCS to a local file. Blobs of 32 MiB or more are
+    downloaded as concurrent ranged requests written in place, which uses
+    much more of the available bandwidth than a single stream; smaller
+    blobs are downloaded in a single request.
+    Service account must have (at least) read permissions on the bucket/blob.
+
+    .. code:: python
+
+        from bibtutils.gcp.storage import download_gcs_file
+        download_gcs_file('my_bucket', 'my_blob', '/tmp/my_large_export.json')
+
+    :type bucket_name: :py:class:`str`
+    :param bucket_name: the bucket hosting the specified blob.
+
+    :type blob_name: :py:class:`str`
+    :param blob_name: the blob to read from GCS.
+
+    :type filename: :py:class:`str`
+    :param filename: the path of the file to write.
+
+    :type max_workers: :py:class:`int`
+    :param max_workers: (Optional) the maximum number of chunks to download
+        concurrently. Defaults to ``8``.
+
+    :type credentials: :py:class:`google_auth:google.oauth2.credentials.Credentials`
+    :param credentials: the credentials object to use when making the API call, if not to
+        use the account running the function for authentication.
+    """
+    client = _get_client(credentials)
+    blob = client.bucket(bucket_name).blob(blob_name)
+    _LOGGER.info("Downloading gs://%s/%s to %s", bucket_name, blob_name, filename)
+    # The blob's size decides how to download it, and is needed to split it
+    # into chunks.
+    blob.reload()
+    if blob.size < _PARALLEL_MIN_BYTES:
+        blob.download_to_filename(filename)
+    else:
+        transfer_manager.download_chunks_concurrently(
+            blob,
+            filename,
+            worker_type=transfer_manager.THREAD,
+            max_workers=max_workers,
+        )
+    _LOGGER.info("Download complete.")
+    return
+
+
+def write_gcs_nldjson(
+    bucket_name, blob_name, json_data, add_date=False, compress=None, **kwargs
+):
     """
     Writes a dict to GCS storage under a given blob name to the given bucket.
     The executing account must have (at least) write permissions to the bucket.
@@ -225,9 +753,11 @@ def write_gcs_nldjson(bucket_name, blob_name, json_data, add_date=False, **kwarg
     :type blob_name: :py:class:`str`
     :param blob_name: the name of the blob to write.
 
-    :type json_data: :py:class:`list` OR :py:class:`dict`
+    :type json_data: :py:class:`list` OR :py:class:`dict` OR :py:class:`pandas.DataFrame` OR :py:class:`pyarrow.Table`
     :param json_data: the data to be written. can be a list or a dict.
         will treat a dict as one row of data (and convert it to a one-item list).
+        a DataFrame or Arrow table is serialized column-wise by pandas,
+        which is much faster than row by row for large tables.
         data will be converted to a JSON NLD formatted string
         before uploading for compatibility with
         :func:`~bibtutils.gcp.bigquery.upload_gcs_json`.
@@ -240,16 +770,28 @@ def write_gcs_nldjson(bucket_name, blob_name, json_data, add_date=False, **kwarg
     :param create_bucket_if_not_found: (Optional) if ``True``, will attempt to
         create the bucket if it does not exist. Defaults to ``False``.
 
+    :type compress: :py:class:`str`
+    :param compress: (Optional) set to ``'gzip'`` to gzip the data before
+        upload, which typically shrinks JSON NLD 5-20x. The blob is stored
+        with ``Content-Encoding: gzip``, so GCS serves it decompressed and
+        BQ can load it as usual. Defaults to ``None`` (no compression).
     """
     nld_json = _generate_json_nld(json_data, add_date)
+    if compress == "gzip":
+        _LOGGER.info("Compressing JSON NLD...")
+        nld_json = gzip.compress(nld_json, compresslevel=1)
+        kwargs["content_encoding"] = "gzip"
+    elif compress is not None:
+        raise ValueError(f"Unsupported compression: {compress}. Use 'gzip'.")
     write_gcs(bucket_name, blob_name, nld_json, **kwargs)
     return
 
 
 def _generate_json_nld(json_data, add_date):
     """
-    Takes a dict object and returns a string in JSON NLD format.
-    Compatible with uploading to BQ.
+    Takes a dict object and returns UTF-8 encoded bytes in JSON NLD
+    format. Compatible with uploading to BQ. Rows are serialized with
+    ``orjson`` if it is installed.
 
     :type json_data: :py:class:`dict`
     :param json_data: the data to be converted to JSON NLD.
@@ -258,16 +800,54 @@ def _generate_json_nld(json_data, add_date):
     :param add_date: whether or not to add upload date to the
         data before upload.
 
-    :rtype: :py:class:`str`
+    :rtype: :py:class:`bytes`
     :returns: formatted JSON NLD.
     """
     _LOGGER.info("Generating JSON NLD...")
-    json_nld = ""
+    if type(json_data).__module__.split(".")[0] in ("pandas", "pyarrow"):
+        json_nld = _generate_json_nld_frame(json_data, add_date)
+        _LOGGER.info("Generated.")
+        return json_nld
     if isinstance(json_data, dict):
         json_data = [json_data]
-    for item in json_data:
-        if add_date:
-            item["upload_date"] = datetime.date.today().isoformat()
-        json_nld += f"{json.dumps(item)}\n"
+    if add_date:
+        today = datetime.date.today().isoformat()
+        for item in json_data:
+            item["upload_date"] = today
+    if orjson is not None:
+        dumps = orjson.dumps
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        json_nld = b"".join([dumps(item, option=option) for item in json_data])
+    else:
+        dumps = json.dumps
+        json_nld = "".join([f"{dumps(item)}\n" for item in json_data]).encode("utf-8")
     _LOGGER.info("Generated.")
     return json_nld
+
+
+def _generate_json_nld_frame(frame, add_date):
+    """
+    Helper method to convert a pandas DataFrame or pyarrow Table to JSON
+    NLD. pandas serializes whole columns in C, so this avoids a Python
+    loop over the rows. Converting a pyarrow Table requires ``pandas``.
+
+    :type frame: :py:class:`pandas.DataFrame` OR :py:class:`pyarrow.Table`
+    :param frame: the data to be converted to JSON NLD.
+
+    :type add_date: :py:class:`bool`
+    :param add_date: whether or not to add upload date to the
+        data before upload.
+
+    :rtype: :py:class:`bytes`
+    :returns: formatted JSON NLD.
+    """
+    if hasattr(frame, "to_pandas"):
+        frame = frame.to_pandas()
+    if add_date:
+        frame = frame.assign(upload_date=datetime.date.today().isoformat())
+    json_nld = frame.to_json(
+        orient="records", lines=True, date_format="iso", force_ascii=False
+    )
+    if json_nld and not json_nld.endswith("\n"):
+        json_nld += "\n"
+    return json_nld.encode("utf-8")
@@ -5,10 +5,13 @@ bibtutils.slack.error
 Enables sending alerts (crashes and other errors) to Slack.
 
 """
+import functools
 import logging
 import os
+from urllib.parse import quote
 from warnings import warn
 
+from bibtutils.slack.message import asend_message
 from bibtutils.slack.message import send_message
 
 warn(
@@ -18,12 +21,26 @@ warn(
 )
 _LOGGER = logging.getLogger(__name__)
 
+# Logs Explorer link to a function's logs over a time range; the query is
+# already URL-escaped, and the values filled in must be escaped with quote().
+_LOGS_URL_TEMPLATE = (
+    "https://console.cloud.google.com/logs/query;query="
+    "resource.type%3D%22cloud_function%22%0A"
+    "resource.labels.function_name%3D%22{cfname}%22;"
+    "timeRange={start}%2F{end}"
+    "?project={project}"
+)
+
+_ALERT_COLOR = "#ff0000"
 
+
+@functools.lru_cache(maxsize=1)
 def _get_cfname():
     """Helper function to get the current cloud function name.
     References environment variables set by GCP (``'K_SERVICE'`` for Python 3.8+,
     or ``'FUNCTION_NAME'`` for Python 3.7). If neither value is set,
-    returns ``'UNKNOWN'``.
+    returns ``'UNKNOWN'``. These don't change for the life of the
+    process, so the result is cached.
 
     :rtype: :py:class:`str`
     :returns: the cloud function name.
@@ -35,7 +52,9 @@ def _get_cfname():
     return cfname
 
 
-def send_cf_fail_alert(currenttime, eventtime, webhook, proj_envar="_GOOGLE_PROJECT"):
+def send_cf_fail_alert(
+    currenttime, eventtime, webhook, proj_envar="_GOOGLE_PROJECT", wait=True
+):
     """Sends a cloud function runtime failure alert to Slack.
     Automatically called by the :func:`~bibtutils.gcp.pubsub.process_trigger`
     method if function retry threshold is exceeded. Will include an
@@ -56,29 +75,62 @@ def send_cf_fail_alert(currenttime, eventtime, webhook, proj_envar="_GOOGLE_PROJ
     :type proj_envar: :py:class:`str`
     :param proj_envar: (Optional) the environment variable to
         reference for current GCP project. Defaults to ``'_GOOGLE_PROJECT'``.
+
+    :type wait: :py:class:`bool`
+    :param wait: (Optional) whether or not to block until the alert is
+        posted. See :func:`~bibtutils.slack.message.send_message`.
+        Defaults to ``True``.
+
+    :rtype: :py:class:`concurrent.futures.Future` OR ``None``
+    :returns: if ``wait=False``, a future which resolves once the alert
+        has been posted.
+    """
+    title, text = _cf_fail_alert(currenttime, eventtime, proj_envar)
+    return send_message(webhook, title, text, _ALERT_COLOR, wait=wait)
+
+
+async def asend_cf_fail_alert(
+    currenttime, eventtime, webhook, proj_envar="_GOOGLE_PROJECT"
+):
+    """
+    Coroutine which sends a cloud function runtime failure alert to Slack;
+    see :func:`~bibtutils.slack.error.send_cf_fail_alert`. Alerts awaited
+    together with :func:`asyncio.gather` are posted concurrently.
+    """
+    title, text = _cf_fail_alert(currenttime, eventtime, proj_envar)
+    await asend_message(webhook, title, text, _ALERT_COLOR)
+    return
+
+
+def _cf_fail_alert(currenttime, eventtime, proj_envar):
+    """
+    Helper method to build the title and text of a cloud function runtime
+    failure alert.
+
+    :rtype: :py:class:`tuple`
+    :returns: the alert's title and text.
     """
     ctimestamp = currenttime.strftime("%Y%m%dT%H%M%SZ")
     etimestamp = eventtime.strftime("%Y%m%dT%H%M%SZ")
     cfname = _get_cfname()
-    hyperlink = (
-        "https://console.cloud.google.com/logs/query;query="
-        "resource.type%3D%22cloud_function%22%0A"
-        f"resource.labels.function_name%3D%22{cfname}%22;"
-        f"timeRange={etimestamp}%2F{ctimestamp}"
-        f'?project={os.environ.get("_GOOGLE_PROJECT")}'
+    project = os.environ.get(proj_envar)
+    hyperlink = _LOGS_URL_TEMPLATE.format(
+        cfname=quote(cfname, safe=""),
+        start=etimestamp,
+        end=ctimestamp,
+        project=quote(str(project), safe=""),
     )
     title = ":exclamation: *Cloud Function Failed* :exclamation: @here"
     text = (
-        f"`{cfname}` exceeded its retry threshold in "
-        f'`{os.environ.get("_GOOGLE_PROJECT")}`\n'
+        f"`{cfname}` exceeded its retry threshold in `{project}`\n"
         f"See logs here: <{hyperlink}|Logs Explorer>"
     )
-    color = "#ff0000"
-    send_message(webhook, title, text, color)
-    return
+    return title, text
 
 
-def send_cf_error(message, webhook, proj_envar="_GOOGLE_PROJECT"):
+def send_cf_error(
+    message, webhook, proj_envar="_GOOGLE_PROJECT", wait=True, dedup_secs=None
+):
     """Sends an error message to Slack. Not necessarily indicative of a crash.
 
     .. code:: python
@@ -104,13 +156,49 @@ def send_cf_error(message, webhook, proj_envar="_GOOGLE_PROJECT"):
     :type proj_envar: :py:class:`str`
     :param proj_envar: (Optional) the environment variable to
         reference for current GCP project. Defaults to ``'_GOOGLE_PROJECT'``.
+
+    :type wait: :py:class:`bool`
+    :param wait: (Optional) whether or not to block until the alert is
+        posted. See :func:`~bibtutils.slack.message.send_message`.
+        Defaults to ``True``.
+
+    :type dedup_secs: :py:class:`float`
+    :param dedup_secs: (Optional) drop this message if an identical one was
+        sent within this many seconds. See
+        :func:`~bibtutils.slack.message.send_message`. Defaults to ``None``.
+
+    :rtype: :py:class:`concurrent.futures.Future` OR ``None``
+    :returns: if ``wait=False``, a future which resolves once the alert
+        has been posted.
+    """
+    title = _cf_error_title(proj_envar)
+    return send_message(
+        webhook, title, message, _ALERT_COLOR, wait=wait, dedup_secs=dedup_secs
+    )
+
+
+async def asend_cf_error(
+    message, webhook, proj_envar="_GOOGLE_PROJECT", dedup_secs=None
+):
+    """
+    Coroutine which sends an error message to Slack; see
+    :func:`~bibtutils.slack.error.send_cf_error`. Messages awaited together
+    with :func:`asyncio.gather` are posted concurrently.
+    """
+    title = _cf_error_title(proj_envar)
+    await asend_message(webhook, title, message, _ALERT_COLOR, dedup_secs=dedup_secs)
+    return
+
+
+def _cf_error_title(proj_envar):
+    """
+    Helper method to build the title of a cloud function error message.
+
+    :rtype: :py:class:`str`
+    :returns: the message title.
     """
     cfname = _get_cfname()
-    title = (
+    return (
         ":exclamation: *Cloud Function Encountered Error* :exclamation: @here\n"
         f"\t- *Project*: `{os.environ.get(proj_envar)}`\n\t- *Function*: `{cfname}`"
     )
-    text = message
-    color = "#ff0000"
-    send_message(webhook, title, text, color)
-    return
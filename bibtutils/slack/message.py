@@ -5,10 +5,22 @@ bibtutils.slack.message
 Enables sending messages to Slack.
 
 """
+import asyncio
+import functools
+import json
 import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from warnings import warn
 
-import requests
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 warn(
     "This library is deprecated. Please use a supported library: "
@@ -19,8 +31,90 @@ _LOGGER = logging.getLogger(__name__)
 
 SLACK_MAX_TEXT_LENGTH = 3000 - 35
 
+# (connect, read) timeouts for each post, so an unresponsive webhook can't
+# hang the caller.
+_TIMEOUT = (3.05, 10)
 
-def send_message(webhook, title, text=None, color=None, blocks=None, dividers=False):
+# Attempts made per post after the first. Only failures where Slack can't
+# have accepted the message are retried, so with _TIMEOUT a post blocks for
+# at most about a minute (plus any Retry-After delay Slack asks for).
+_RETRIES = 3
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Posts messages sent with wait=False. Its threads are joined at interpreter
+# exit, so queued messages are still delivered when a script ends.
+_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bibtutils-slack")
+_PENDING = set()
+_PENDING_LOCK = threading.Lock()
+
+# When each recent message was sent, for suppressing duplicates; only the
+# most recent _RECENT_MAX messages are remembered.
+_RECENT = OrderedDict()
+_RECENT_LOCK = threading.Lock()
+_RECENT_MAX = 256
+
+
+@functools.lru_cache(maxsize=1)
+def _get_session():
+    """
+    Helper method to return the shared keep-alive session, so that a burst
+    of messages reuses one connection to hooks.slack.com instead of a new
+    TLS handshake per message. Connection errors, rate limiting (429) and
+    unavailability (503) are retried with backoff; read errors, timeouts
+    and other server errors are not, since Slack may already have posted
+    the message. ``requests`` is imported on first use rather
+    than with this module, to keep it off the cold-start path of Cloud
+    Functions which never send a message.
+
+    :rtype: :py:class:`requests.Session`
+    :returns: the session.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class _JitterRetry(Retry):
+        """
+        Retry policy which sleeps for a random time between zero and the
+        usual exponential backoff ("full jitter"), so that many processes
+        alerting at once don't retry in lockstep. A ``Retry-After`` header,
+        when sent, still takes precedence.
+        """
+
+        def get_backoff_time(self):
+            return random.uniform(0, super().get_backoff_time())
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=_JitterRetry(
+                total=_RETRIES,
+                read=0,
+                backoff_factor=0.5,
+                status_forcelist=[429, 503],
+                allowed_methods=frozenset(["POST"]),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
+
+
+def send_message(
+    webhook,
+    title,
+    text=None,
+    color=None,
+    blocks=None,
+    dividers=False,
+    wait=True,
+    dedup_secs=None,
+):
     """Sends a message to Slack.
 
     .. code:: python
@@ -49,19 +143,189 @@ def send_message(webhook, title, text=None, color=None, blocks=None, dividers=Fa
 
     :type color: :py:class:`str`
     :param color: the color to use for the Slack attachment border.
+
+    :type wait: :py:class:`bool`
+    :param wait: (Optional) whether or not to block until Slack has accepted
+        the message (at worst about a minute, if Slack is unreachable or
+        keeps rate limiting, plus any Retry-After delay). If ``False``, the message is posted on a background
+        thread and a future is returned instead; use
+        :func:`~bibtutils.slack.message.flush_messages` to wait for all
+        such messages. Note that Cloud Functions may throttle background
+        threads once the function returns, so flush before returning.
+        Defaults to ``True``.
+
+    :type dedup_secs: :py:class:`float`
+    :param dedup_secs: (Optional) if specified, a message identical to one
+        sent to the same webhook by this process within the last
+        ``dedup_secs`` seconds is dropped instead of sent, e.g. to stop a
+        retry storm flooding a channel with the same error. A message whose
+        post fails is not remembered, so it may be retried straight away.
+        Defaults to ``None`` (send every message).
+
+    :rtype: :py:class:`concurrent.futures.Future` OR ``None``
+    :returns: if ``wait=False``, a future which resolves once the message
+        has been posted (``None`` if it was dropped as a duplicate).
+    """
+    msg = _build_message(title, text, color, blocks, dividers)
+    if dedup_secs and _sent_recently(webhook, msg, dedup_secs):
+        return
+    if wait:
+        _deliver(webhook, msg, dedup_secs)
+        return
+    future = _POOL.submit(_deliver, webhook, msg, dedup_secs)
+    with _PENDING_LOCK:
+        _PENDING.add(future)
+    future.add_done_callback(_discard_pending)
+    return future
+
+
+async def asend_message(
+    webhook, title, text=None, color=None, blocks=None, dividers=False, dedup_secs=None
+):
+    """
+    Coroutine which sends a message to Slack. The post runs on the event
+    loop's default executor, sharing the keep-alive session used by
+    :func:`~bibtutils.slack.message.send_message`, so several messages
+    awaited together with :func:`asyncio.gather` are posted concurrently
+    rather than one round trip after another.
+
+    .. code:: python
+
+        import asyncio
+        from bibtutils.slack.message import asend_message
+        async def main():
+            await asyncio.gather(
+                asend_message(webhook, 'First', text='one'),
+                asend_message(webhook, 'Second', text='two'),
+            )
+        asyncio.run(main())
+
+    The arguments are the same as for
+    :func:`~bibtutils.slack.message.send_message`, except ``wait``.
+    """
+    msg = _build_message(title, text, color, blocks, dividers)
+    if dedup_secs and _sent_recently(webhook, msg, dedup_secs):
+        return
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, _deliver, webhook, msg, dedup_secs)
+    return
+
+
+def send_many(messages, **kwargs):
+    """
+    Sends several messages to Slack concurrently, so the total wait is
+    roughly that of the slowest post rather than the sum of all of them.
+    Any extra arguments (``kwargs``) are passed to the
+    :func:`~bibtutils.slack.message.asend_many` coroutine.
+
+    Must not be called from a running event loop; await
+    :func:`~bibtutils.slack.message.asend_many` there instead.
+
+    .. code:: python
+
+        from bibtutils.slack.message import send_many
+        send_many(
+            [
+                {'webhook': team_a_webhook, 'title': 'Job failed', 'text': msg},
+                {'webhook': team_b_webhook, 'title': 'Job failed', 'text': msg},
+            ]
+        )
+
+    :type messages: :py:class:`list`
+    :param messages: a list of dicts, each being the keyword arguments for
+        one call to :func:`~bibtutils.slack.message.asend_message`.
+    """
+    return asyncio.run(asend_many(messages, **kwargs))
+
+
+async def asend_many(messages, max_concurrency=8):
+    """
+    Coroutine which sends several messages to Slack concurrently. Every
+    message is attempted even if some fail; the first error is raised once
+    all of them have finished.
+
+    :type messages: :py:class:`list`
+    :param messages: a list of dicts, each being the keyword arguments for
+        one call to :func:`~bibtutils.slack.message.asend_message`.
+
+    :type max_concurrency: :py:class:`int`
+    :param max_concurrency: (Optional) the maximum number of posts in
+        flight at once. Defaults to ``8``.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def send(message):
+        async with semaphore:
+            await asend_message(**message)
+
+    _LOGGER.info("Sending %s Slack messages...", len(messages))
+    results = await asyncio.gather(
+        *[send(message) for message in messages], return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    return
+
+
+def flush_messages(timeout=None):
+    """
+    Waits for all messages sent with ``wait=False`` to be posted, raising
+    the first error encountered.
+
+    .. code:: python
+
+        from bibtutils.slack.message import flush_messages, send_message
+        send_message(webhook, 'Job finished', text='All done!', wait=False)
+        ...
+        flush_messages(timeout=5)
+
+    :type timeout: :py:class:`float`
+    :param timeout: (Optional) the maximum number of seconds to wait, e.g.
+        to bound the time spent alerting before a function returns.
+        Messages still pending afterwards keep posting in the background.
+        Defaults to ``None`` (wait for all of them).
+
+    :rtype: :py:class:`int`
+    :returns: the number of messages still pending.
+    """
+    with _PENDING_LOCK:
+        futures = list(_PENDING)
+    _LOGGER.info("Waiting on %s Slack messages...", len(futures))
+    done, not_done = wait_futures(futures, timeout=timeout)
+    for future in futures:
+        if future in done:
+            future.result()
+    if not_done:
+        _LOGGER.warning(
+            "%s Slack messages still pending after %ss.", len(not_done), timeout
+        )
+    return len(not_done)
+
+
+def _build_message(title, text, color, blocks, dividers):
+    """
+    Helper method to build the Slack payload for
+    :func:`~bibtutils.slack.message.send_message` and
+    :func:`~bibtutils.slack.message.asend_message`, truncating any text
+    which exceeds Slack's limit.
+
+    :rtype: :py:class:`dict`
+    :returns: the message payload.
     """
     if not color:
         color = "#000000"
     if text:
-        if len(text) > SLACK_MAX_TEXT_LENGTH:
-            text = text[:SLACK_MAX_TEXT_LENGTH] + "\n..."
         msg = {
             "blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": title}}],
             "attachments": [
                 {
                     "color": color,
                     "blocks": [
-                        {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+                        {
+                            "type": "section",
+                            "text": {"type": "mrkdwn", "text": _truncate(text)},
+                        }
                     ],
                 }
             ],
@@ -76,17 +340,102 @@ def send_message(webhook, title, text=None, color=None, blocks=None, dividers=Fa
                 }
             ],
         }
+        append = msg["attachments"][0]["blocks"].append
+        # Dividers are identical, so one dict is shared between them.
+        divider = {"type": "divider"}
         for block in blocks:
-            if len(block) > SLACK_MAX_TEXT_LENGTH:
-                block = block[:SLACK_MAX_TEXT_LENGTH] + "\n..."
-            msg["attachments"][0]["blocks"].append(
-                {"type": "section", "text": {"type": "mrkdwn", "text": block}}
+            append(
+                {
+                    "type": "section",
+                    "text": {"type": "mrkdwn", "text": _truncate(block)},
+                }
             )
             if dividers:
-                msg["attachments"][0]["blocks"].append({"type": "divider"})
-
+                append(divider)
     else:
         raise Exception("Either text or blocks must be passed.")
-    r = requests.post(webhook, json=msg)
+    return msg
+
+
+def _sent_recently(webhook, msg, dedup_secs):
+    """
+    Helper method to check whether an identical message was sent to the
+    same webhook within the last ``dedup_secs`` seconds, recording this
+    message as sent if not. The record is made before posting, so that
+    concurrent duplicates are also dropped, and removed again by
+    :func:`~bibtutils.slack.message._deliver` if the post fails.
+
+    :rtype: :py:class:`bool`
+    :returns: whether or not the message is a duplicate.
+    """
+    key = (webhook, repr(msg))
+    now = time.monotonic()
+    with _RECENT_LOCK:
+        sent_at = _RECENT.get(key)
+        if sent_at is not None and now - sent_at < dedup_secs:
+            _LOGGER.info("Dropping duplicate Slack message.")
+            return True
+        _RECENT[key] = now
+        _RECENT.move_to_end(key)
+        if len(_RECENT) > _RECENT_MAX:
+            _RECENT.popitem(last=False)
+    return False
+
+
+def _forget_sent(webhook, msg):
+    """
+    Helper method to drop a message from the record kept by
+    :func:`~bibtutils.slack.message._sent_recently`.
+    """
+    with _RECENT_LOCK:
+        _RECENT.pop((webhook, repr(msg)), None)
+
+
+def _deliver(webhook, msg, dedup_secs=None):
+    """
+    Helper method to post a message. If the post fails, the message is
+    forgotten by the duplicate check, so that retrying it isn't dropped.
+    """
+    try:
+        _post(webhook, msg)
+    except Exception:
+        if dedup_secs:
+            _forget_sent(webhook, msg)
+        raise
+
+
+def _truncate(text):
+    """
+    Helper method to cut text down to the length Slack accepts in a
+    single block, marking that it was cut.
+    """
+    if len(text) > SLACK_MAX_TEXT_LENGTH:
+        return text[:SLACK_MAX_TEXT_LENGTH] + "\n..."
+    return text
+
+
+def _post(webhook, msg):
+    """
+    Helper method to post a message to a Slack webhook, raising on an
+    unsuccessful response. The payload is serialized with ``orjson`` if it
+    is installed, rather than by ``requests`` with the stdlib encoder.
+    """
+    if orjson is not None:
+        data = orjson.dumps(msg)
+    else:
+        # The payload is a tree of plain dicts and strings built here, so
+        # the circular-reference check can be skipped.
+        data = json.dumps(
+            msg, ensure_ascii=False, separators=(",", ":"), check_circular=False
+        ).encode("utf-8")
+    r = _get_session().post(webhook, data=data, headers=_JSON_HEADERS, timeout=_TIMEOUT)
     r.raise_for_status()
     return
+
+
+def _discard_pending(future):
+    """
+    Helper method to stop tracking a message once it has been posted.
+    """
+    with _PENDING_LOCK:
+        _PENDING.discard(future)
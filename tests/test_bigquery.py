@@ -0,0 +1,67 @@
+import asyncio
+import types
+
+import pytest
+from google.auth.exceptions import RefreshError
+
+from bibtutils.gcp import bigquery
+
+
+def test_query_async_raises_job_errors(monkeypatch):
+    def result():
+        raise RefreshError("token expired")
+
+    job = types.SimpleNamespace(result=result)
+    client = types.SimpleNamespace(query=lambda query, job_config=None: job)
+    monkeypatch.setattr(bigquery, "_get_client", lambda *args: client)
+
+    async def main():
+        return await asyncio.wait_for(bigquery.query_async("select 1"), timeout=5)
+
+    with pytest.raises(RefreshError):
+        asyncio.run(main())
+
+
+@pytest.fixture
+def get_table_calls(monkeypatch):
+    calls = []
+
+    def get_table(table_id):
+        calls.append(table_id)
+        return types.SimpleNamespace(schema=[f"{table_id}#{len(calls)}"])
+
+    client = types.SimpleNamespace(get_table=get_table)
+    monkeypatch.setattr(bigquery, "_get_client", lambda *args: client)
+    monkeypatch.setattr(bigquery, "_SCHEMA_CACHE", {})
+    return calls
+
+
+def test_get_schema_cached(get_table_calls):
+    first = bigquery._get_schema("p", "d", "t")
+    assert bigquery._get_schema("p", "d", "t") is first
+    assert get_table_calls == ["p.d.t"]
+
+
+def test_get_schema_refresh_only_replaces_that_table(get_table_calls):
+    bigquery._get_schema("p", "d", "t1")
+    other = bigquery._get_schema("p", "d", "t2")
+    refreshed = bigquery._get_schema("p", "d", "t1", refresh=True)
+    assert refreshed == ["p.d.t1#3"]
+    assert bigquery._get_schema("p", "d", "t1") is refreshed
+    assert bigquery._get_schema("p", "d", "t2") is other
+    assert len(get_table_calls) == 3
+
+
+def test_clear_schema_cache(get_table_calls):
+    for table in ["p.d.t1", "p.d.t2", "p.e.t1", "q.d.t1"]:
+        bigquery._get_schema(*table.split("."))
+    bigquery.clear_schema_cache("p", "d", "t1")
+    assert {key[:3] for key in bigquery._SCHEMA_CACHE} == {
+        ("p", "d", "t2"),
+        ("p", "e", "t1"),
+        ("q", "d", "t1"),
+    }
+    bigquery.clear_schema_cache("p")
+    assert {key[:3] for key in bigquery._SCHEMA_CACHE} == {("q", "d", "t1")}
+    bigquery.clear_schema_cache()
+    assert bigquery._SCHEMA_CACHE == {}
@@ -0,0 +1,101 @@
+import datetime
+
+import pytest
+from google.cloud.bigquery import SchemaField
+
+from bibtutils.gcp import bigquery_stream
+from bibtutils.gcp.bigquery_stream import _descriptor_proto
+from bibtutils.gcp.bigquery_stream import _fill_message
+from bibtutils.gcp.bigquery_stream import _row_message
+
+SCHEMA = (
+    SchemaField("name", "STRING"),
+    SchemaField("count", "INTEGER"),
+    SchemaField("created", "TIMESTAMP"),
+    SchemaField("day", "DATE"),
+    SchemaField("tags", "STRING", mode="REPEATED"),
+    SchemaField(
+        "owner",
+        "RECORD",
+        fields=(SchemaField("email", "STRING"), SchemaField("since", "DATE")),
+    ),
+)
+
+
+def test_descriptor_proto_fields():
+    proto = _descriptor_proto(SCHEMA, "Row")
+    assert [f.name for f in proto.field] == [
+        "name",
+        "count",
+        "created",
+        "day",
+        "tags",
+        "owner",
+    ]
+    assert [f.number for f in proto.field] == [1, 2, 3, 4, 5, 6]
+    tags = proto.field[4]
+    assert tags.label == tags.LABEL_REPEATED
+    owner = proto.field[5]
+    assert owner.type == owner.TYPE_MESSAGE
+    assert owner.type_name == "Row_owner"
+    assert [t.name for t in proto.nested_type] == ["Row_owner"]
+    assert [f.name for f in proto.nested_type[0].field] == ["email", "since"]
+
+
+def test_fill_message():
+    _, message_class = _row_message(SCHEMA)
+    message = message_class()
+    _fill_message(
+        message,
+        {
+            "name": "leo",
+            "count": None,
+            "created": datetime.datetime(1970, 1, 1, 0, 0, 1),
+            "day": datetime.date(1970, 1, 11),
+            "tags": ["a", "b"],
+            "owner": {"email": "leo@example.com", "since": "1970-01-02"},
+        },
+        SCHEMA,
+    )
+    assert message.name == "leo"
+    assert not message.HasField("count")
+    assert message.created == 1_000_000
+    assert message.day == 10
+    assert list(message.tags) == ["a", "b"]
+    assert message.owner.email == "leo@example.com"
+    assert message.owner.since == 1
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "1970-01-01T00:00:01Z",
+        "1970-01-01T00:00:01+00:00",
+        "1970-01-01T01:00:01+01:00",
+        "1970-01-01T00:00:01.000000000Z",
+    ],
+)
+def test_fill_message_iso_timestamp(value):
+    _, message_class = _row_message(SCHEMA)
+    message = message_class()
+    _fill_message(message, {"created": value}, SCHEMA)
+    assert message.created == 1_000_000
+
+
+def test_fill_message_unknown_column():
+    _, message_class = _row_message(SCHEMA)
+    with pytest.raises(ValueError, match="colour"):
+        _fill_message(message_class(), {"colour": "red"}, SCHEMA)
+
+
+def test_stream_rows_unknown_column_refreshes_schema(monkeypatch):
+    calls = []
+
+    def fake_get_schema(bq_project, dataset, table, credentials=None, refresh=False):
+        calls.append(refresh)
+        return SCHEMA
+
+    monkeypatch.setattr(bigquery_stream, "_get_schema", fake_get_schema)
+    with pytest.raises(ValueError, match="colour"):
+        bigquery_stream.stream_rows("proj", "ds", "tbl", [{"colour": "red"}])
+    assert calls == [False, True]
@@ -0,0 +1,54 @@
+import datetime
+import time
+import types
+
+import pytest
+
+from bibtutils.gcp import iam
+
+
+class FakeIAMClient:
+    def __init__(self, prefix="t"):
+        self.prefix = prefix
+        self.calls = 0
+
+    def generate_access_token(self, name, scope):
+        self.calls += 1
+        return types.SimpleNamespace(
+            access_token=f"{self.prefix}{self.calls}",
+            expire_time=datetime.datetime.fromtimestamp(
+                time.time() + 3600, datetime.timezone.utc
+            ),
+        )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = FakeIAMClient()
+    monkeypatch.setattr(iam, "_get_iam_client", lambda: client)
+    monkeypatch.setattr(iam, "_TOKEN_CACHE", {})
+    return client
+
+
+def test_get_access_token_cached(client):
+    assert iam.get_access_token("sa@example.com") == "t1"
+    assert iam.get_access_token("sa@example.com") == "t1"
+    assert client.calls == 1
+
+
+def test_get_access_token_with_client_bypasses_cache(client):
+    assert iam.get_access_token("sa@example.com") == "t1"
+    other = FakeIAMClient(prefix="other")
+    assert iam.get_access_token("sa@example.com", client=other) == "other1"
+    assert iam.get_access_token("sa@example.com", client=other) == "other2"
+    assert iam.get_access_token("sa@example.com") == "t1"
+
+
+def test_get_credentials_refreshes(client):
+    creds = iam.get_credentials("sa@example.com")
+    assert creds.token == "t1"
+    assert creds.valid
+    iam._TOKEN_CACHE.clear()
+    creds.refresh(None)
+    assert creds.token == "t2"
+    assert creds.valid
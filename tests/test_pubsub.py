@@ -0,0 +1,61 @@
+import datetime
+import json
+
+import pytest
+
+from bibtutils.gcp import pubsub
+
+
+@pytest.fixture(params=["orjson", "json"])
+def serializer(request, monkeypatch):
+    if request.param == "orjson":
+        monkeypatch.setattr(pubsub, "orjson", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(pubsub, "orjson", None)
+    return request.param
+
+
+def test_dumps(serializer):
+    created = datetime.datetime(2023, 1, 1, 12, 30, tzinfo=datetime.timezone.utc)
+    payload = {"name": "leo", "count": 3, "nested": {"ok": True}, 1: "x"}
+    payload["created"] = created
+    data = pubsub._dumps(payload)
+    assert isinstance(data, bytes)
+    assert json.loads(data) == {
+        "name": "leo",
+        "count": 3,
+        "nested": {"ok": True},
+        "1": "x",
+        "created": str(created),
+    }
+
+
+def test_dumps_unicode(serializer):
+    assert json.loads(pubsub._dumps({"color": "bleu ciel ☁"})) == {
+        "color": "bleu ciel ☁"
+    }
+
+
+@pytest.fixture(params=["ciso8601", "fallback"])
+def parser(request, monkeypatch):
+    if request.param == "ciso8601":
+        monkeypatch.setattr(pubsub, "ciso8601", pytest.importorskip("ciso8601"))
+    else:
+        monkeypatch.setattr(pubsub, "ciso8601", None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        "2023-01-01T12:30:00.123456Z",
+        "2023-01-01T14:30:00.123456+02:00",
+        "2023-01-01T12:30:00.123456789Z",
+    ],
+)
+def test_parse_timestamp(parser, timestamp):
+    parsed = pubsub._parse_timestamp(timestamp)
+    assert parsed.tzinfo is not None
+    assert parsed == datetime.datetime(
+        2023, 1, 1, 12, 30, 0, 123456, tzinfo=datetime.timezone.utc
+    )
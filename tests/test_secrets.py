@@ -0,0 +1,72 @@
+import types
+
+import pytest
+
+from bibtutils.gcp import secrets
+
+URI = "projects/p/secrets/s/versions/latest"
+
+
+class FakeSecretClient:
+    def __init__(self):
+        self.calls = []
+
+    def access_secret_version(self, request, timeout=None, retry=None):
+        self.calls.append(request["name"])
+        data = f"{request['name']}#{len(self.calls)}".encode()
+        return types.SimpleNamespace(payload=types.SimpleNamespace(data=data))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = FakeSecretClient()
+    monkeypatch.setattr(secrets, "_get_client", lambda credentials=None: client)
+    monkeypatch.setattr(secrets, "_SECRET_CACHE", {})
+    return client
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(secrets.time, "monotonic", lambda: clock[0])
+    return clock
+
+
+def test_no_cache_by_default(client, clock):
+    assert secrets.get_secret_by_uri(URI) == f"{URI}#1"
+    assert secrets.get_secret_by_uri(URI) == f"{URI}#2"
+    assert secrets._SECRET_CACHE == {}
+
+
+def test_cache_secs(client, clock):
+    assert secrets.get_secret_by_uri(URI, cache_secs=60) == f"{URI}#1"
+    clock[0] += 59
+    assert secrets.get_secret_by_uri(URI, cache_secs=60) == f"{URI}#1"
+    clock[0] += 1
+    assert secrets.get_secret_by_uri(URI, cache_secs=60) == f"{URI}#2"
+    assert len(client.calls) == 2
+
+
+def test_cache_bounded_oldest_evicted(client, clock, monkeypatch):
+    monkeypatch.setattr(secrets, "_SECRET_CACHE_MAXSIZE", 2)
+    for name in ["a", "b", "c"]:
+        secrets.get_secret_by_uri(name, cache_secs=60)
+    assert [key[0] for key in secrets._SECRET_CACHE] == ["b", "c"]
+    secrets.get_secret_by_uri("a", cache_secs=60)
+    assert client.calls == ["a", "b", "c", "a"]
+
+
+def test_cache_evicts_expired_entries(client, clock):
+    secrets.get_secret_by_uri("short", cache_secs=10)
+    clock[0] += 10
+    secrets.get_secret_by_uri("long", cache_secs=60)
+    assert [key[0] for key in secrets._SECRET_CACHE] == ["long"]
+
+
+def test_invalidate_secret(client, clock):
+    secrets.get_secret_by_uri("a", cache_secs=60)
+    secrets.get_secret_by_uri("b", cache_secs=60)
+    secrets.invalidate_secret("a")
+    assert [key[0] for key in secrets._SECRET_CACHE] == ["b"]
+    secrets.invalidate_secret()
+    assert secrets._SECRET_CACHE == {}
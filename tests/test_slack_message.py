@@ -0,0 +1,104 @@
+import json
+import types
+from collections import OrderedDict
+
+import pytest
+
+from bibtutils.slack import message
+
+WEBHOOK = "https://hooks.slack.com/services/T000/B000/XXXX"
+
+
+@pytest.fixture
+def posts(monkeypatch):
+    posts = []
+    monkeypatch.setattr(message, "_RECENT", OrderedDict())
+    monkeypatch.setattr(message, "_post", lambda webhook, msg: posts.append(msg))
+    return posts
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(message.time, "monotonic", lambda: clock[0])
+    return clock
+
+
+def test_dedup_window(posts, clock):
+    message.send_message(WEBHOOK, "title", text="text", dedup_secs=60)
+    clock[0] += 30
+    message.send_message(WEBHOOK, "title", text="text", dedup_secs=60)
+    assert len(posts) == 1
+    clock[0] += 31
+    message.send_message(WEBHOOK, "title", text="text", dedup_secs=60)
+    assert len(posts) == 2
+
+
+def test_dedup_distinguishes_messages_and_webhooks(posts, clock):
+    message.send_message(WEBHOOK, "title", text="one", dedup_secs=60)
+    message.send_message(WEBHOOK, "title", text="two", dedup_secs=60)
+    message.send_message(WEBHOOK + "2", "title", text="one", dedup_secs=60)
+    assert len(posts) == 3
+
+
+def test_no_dedup_by_default(posts, clock):
+    message.send_message(WEBHOOK, "title", text="text")
+    message.send_message(WEBHOOK, "title", text="text")
+    assert len(posts) == 2
+
+
+def test_dedup_evicts_oldest(posts, clock, monkeypatch):
+    monkeypatch.setattr(message, "_RECENT_MAX", 2)
+    for text in ["one", "two", "three"]:
+        message.send_message(WEBHOOK, "title", text=text, dedup_secs=60)
+    assert len(message._RECENT) == 2
+    message.send_message(WEBHOOK, "title", text="one", dedup_secs=60)
+    message.send_message(WEBHOOK, "title", text="three", dedup_secs=60)
+    assert len(posts) == 4
+
+
+def test_failed_post_is_not_deduplicated(posts, clock, monkeypatch):
+    def fail(webhook, msg):
+        raise RuntimeError("webhook unavailable")
+
+    monkeypatch.setattr(message, "_post", fail)
+    with pytest.raises(RuntimeError):
+        message.send_message(WEBHOOK, "title", text="text", dedup_secs=60)
+    future = message.send_message(
+        WEBHOOK, "title", text="text", wait=False, dedup_secs=60
+    )
+    with pytest.raises(RuntimeError):
+        future.result()
+    monkeypatch.setattr(message, "_post", lambda webhook, msg: posts.append(msg))
+    message.send_message(WEBHOOK, "title", text="text", dedup_secs=60)
+    assert len(posts) == 1
+
+
+@pytest.fixture(params=["orjson", "json"])
+def session(request, monkeypatch):
+    if request.param == "orjson":
+        monkeypatch.setattr(message, "orjson", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(message, "orjson", None)
+    requests = []
+
+    def post(url, **kwargs):
+        requests.append((url, kwargs))
+        return types.SimpleNamespace(raise_for_status=lambda: None)
+
+    monkeypatch.setattr(
+        message, "_get_session", lambda: types.SimpleNamespace(post=post)
+    )
+    return requests
+
+
+def test_post_serializes_compact_utf8_json(session):
+    msg = {"text": "état ☁", "blocks": [{"type": "divider"}]}
+    message._post(WEBHOOK, msg)
+    [(url, kwargs)] = session
+    assert url == WEBHOOK
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert kwargs["data"] == (
+        '{"text":"état ☁","blocks":[{"type":"divider"}]}'.encode("utf-8")
+    )
+    assert json.loads(kwargs["data"]) == msg
@@ -0,0 +1,174 @@
+import gc
+import gzip
+import io
+import json
+import types
+from collections import namedtuple
+
+import pytest
+from google.cloud.storage.fileio import BlobWriter
+
+from bibtutils.gcp import storage
+
+CHUNK_SIZE = 256 * 1024
+
+
+class FakeUpload:
+    resumable_url = "https://storage.example/upload?upload_id=1"
+
+    def __init__(self):
+        self.stream = None
+        self.chunks_sent = 0
+
+    def transmit_next_chunk(self, transport):
+        self.stream.read(CHUNK_SIZE)
+        self.chunks_sent += 1
+
+
+class FakeTransport:
+    def __init__(self):
+        self.deleted = []
+
+    def delete(self, url, timeout=None):
+        self.deleted.append(url)
+
+
+class FakeBlob:
+    def __init__(self):
+        self.bucket = types.SimpleNamespace(client=None)
+        self.upload = FakeUpload()
+        self.transport = FakeTransport()
+
+    def open(self, mode, chunk_size=None, content_type=None):
+        return BlobWriter(self, chunk_size=chunk_size, content_type=content_type)
+
+    def _initiate_resumable_upload(self, client, stream, *args, **kwargs):
+        self.upload.stream = stream
+        return self.upload, self.transport
+
+
+@pytest.fixture
+def blob(monkeypatch):
+    blob = FakeBlob()
+    client = types.SimpleNamespace(
+        bucket=lambda name: types.SimpleNamespace(blob=lambda name: blob)
+    )
+    monkeypatch.setattr(storage, "_get_client", lambda credentials=None: client)
+    return blob
+
+
+def test_write_gcs_stream_finalizes(blob):
+    storage.write_gcs_stream(
+        "bucket", "blob", [b"a" * CHUNK_SIZE, "b"], chunk_size=CHUNK_SIZE
+    )
+    assert blob.upload.chunks_sent == 2
+    assert blob.transport.deleted == []
+
+
+def test_write_gcs_stream_cancels_on_error(blob):
+    def chunks():
+        yield b"a" * (CHUNK_SIZE + 1)
+        raise RuntimeError("source failed")
+
+    with pytest.raises(RuntimeError, match="source failed"):
+        storage.write_gcs_stream("bucket", "blob", chunks(), chunk_size=CHUNK_SIZE)
+    gc.collect()
+    # Only the full chunk was sent; the remainder was never finalized.
+    assert blob.upload.chunks_sent == 1
+    assert blob.transport.deleted == [FakeUpload.resumable_url]
+
+
+def test_write_gcs_stream_error_before_upload_starts(blob):
+    def chunks():
+        yield b"a"
+        raise RuntimeError("source failed")
+
+    with pytest.raises(RuntimeError):
+        storage.write_gcs_stream("bucket", "blob", chunks(), chunk_size=CHUNK_SIZE)
+    gc.collect()
+    assert blob.upload.chunks_sent == 0
+    assert blob.transport.deleted == []
+
+
+ROWS = [{"name": "leo", "color": "red"}, {"name": "matthew", "color": "blue"}]
+NLD = b"\n".join(json.dumps(row).encode() for row in ROWS) + b"\n\n"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 16, len(NLD), 1024])
+def test_iter_json_lines_chunk_boundaries(chunk_size):
+    stream = io.BytesIO(NLD + json.dumps({"name": "last"}).encode())
+    rows = list(storage._iter_json_lines(stream, chunk_size=chunk_size))
+    assert rows == ROWS + [{"name": "last"}]
+
+
+class FakeReadBlob:
+    def __init__(self, data, content_encoding=None):
+        self.data = data
+        self.content_encoding = None
+        self._stored_encoding = content_encoding
+        self.open_kwargs = None
+
+    def reload(self):
+        self.content_encoding = self._stored_encoding
+
+    def open(self, mode, **kwargs):
+        self.open_kwargs = kwargs
+        return io.BytesIO(self.data)
+
+
+def _patch_read_blob(monkeypatch, blob):
+    client = types.SimpleNamespace(
+        bucket=lambda name: types.SimpleNamespace(blob=lambda name: blob)
+    )
+    monkeypatch.setattr(storage, "_get_client", lambda credentials=None: client)
+
+
+def test_read_gcs_iter_lines(monkeypatch):
+    blob = FakeReadBlob(NLD)
+    _patch_read_blob(monkeypatch, blob)
+    assert list(storage.read_gcs_iter_lines("bucket", "blob")) == ROWS
+    assert blob.open_kwargs["raw_download"] is True
+
+
+def test_read_gcs_iter_lines_gzip(monkeypatch):
+    blob = FakeReadBlob(gzip.compress(NLD), content_encoding="gzip")
+    _patch_read_blob(monkeypatch, blob)
+    assert list(storage.read_gcs_iter_lines("bucket", "blob")) == ROWS
+    assert blob.open_kwargs["raw_download"] is True
+
+
+@pytest.fixture
+def nld_blob(monkeypatch):
+    data = NLD + json.dumps({"name": "last", "size": 3}).encode()
+    monkeypatch.setattr(
+        storage, "read_gcs", lambda bucket_name, blob_name, **kwargs: data
+    )
+
+
+def test_read_gcs_nldjson(nld_blob):
+    assert storage.read_gcs_nldjson("bucket", "blob") == ROWS + [
+        {"name": "last", "size": 3}
+    ]
+
+
+def test_read_gcs_nldjson_columnar(nld_blob):
+    assert storage.read_gcs_nldjson("bucket", "blob", row_factory="columnar") == {
+        "name": ["leo", "matthew", "last"],
+        "color": ["red", "blue", None],
+        "size": [None, None, 3],
+    }
+
+
+def test_read_gcs_nldjson_callable(nld_blob):
+    Row = namedtuple("Row", ["name", "color", "size"], defaults=[None, None])
+    rows = storage.read_gcs_nldjson("bucket", "blob", row_factory=Row)
+    assert rows == [
+        Row("leo", "red"),
+        Row("matthew", "blue"),
+        Row("last", size=3),
+    ]
+
+
+def test_read_gcs_nldjson_invalid_row_factory(nld_blob):
+    with pytest.raises(ValueError, match="Unsupported row_factory"):
+        storage.read_gcs_nldjson("bucket", "blob", row_factory="rows")